@@ -0,0 +1,117 @@
+"""
+Micro-benchmark classify_row() against the legacy multi-pass classifier.
+
+Run from backend/:  python -m benchmarks.bench_classify_row --rows 500000
+"""
+import argparse
+import gc
+import random
+import time
+
+from domain.ingest.checklists import classify_row, safe_get
+
+
+def legacy_classify_row(row, is_parallel):
+    """
+    The multi-pass classifier classify_row() replaced, kept as the
+    benchmark baseline: every branch re-reads and re-strips its cells.
+    """
+    first_col = (safe_get(row, 0) or "").strip()
+    if not first_col:
+        return "unknown", {}
+    elif "parallel" in first_col.lower():
+        return "parallel_marker", {"parallel_name": safe_get(row, 0)}
+    elif safe_get(row, 0) and not safe_get(row, 1) and not safe_get(row, 2) and is_parallel:
+        return "parallel", {"parallel_name": safe_get(row, 0)}
+    elif safe_get(row, 0) and not safe_get(row, 1) and not safe_get(row, 2) and not is_parallel:
+        return "subset", {"subset_name": safe_get(row, 0)}
+    elif safe_get(row, 1) and safe_get(row, 2) and safe_get(row, 3) and safe_get(row, 4):
+        return "master", {
+            "card_number": safe_get(row, 1),
+            "player_name": safe_get(row, 2),
+            "team_name": safe_get(row, 3),
+            "print_run": safe_get(row, 4),
+        }
+    elif safe_get(row, 1) and safe_get(row, 2):
+        return "card", {
+            "card_number": safe_get(row, 1),
+            "player_name": safe_get(row, 2),
+            "team_name": safe_get(row, 3),
+        }
+    else:
+        return "unknown", {}
+
+
+def synthetic_sheet(rows, seed=0):
+    """
+    A values_only-style sheet: subset headers, parallel blocks, card and
+    master rows, and blank rows, six columns wide.
+    """
+    rng = random.Random(seed)
+    sheet = []
+    for i in range(rows):
+        r = rng.random()
+        if i % 500 == 0:
+            sheet.append((f"Subset {i // 500} ", None, None, None, None, None))
+        elif i % 250 == 0:
+            sheet.append(("Parallels", None, None, None, None, None))
+        elif r < 0.05:
+            sheet.append((f"Gold /{i % 99 + 1}", None, None, None, None, None))
+        elif r < 0.45:
+            sheet.append(("TM", i, f" Player {i} ", f"Team {i % 32}", f"{i % 99 + 1}/99", None))
+        elif r < 0.9:
+            sheet.append(("RC", str(i), f"Player {i}", f"Team {i % 32}", None, None))
+        else:
+            sheet.append((None, None, None, None, None, None))
+    return sheet
+
+
+def _run(sheet, classify, collect=False):
+    # Drive the same parallel-mode state machine as iter_sheet()
+    out = []
+    is_parallel = False
+    for row in sheet:
+        mode, vals = classify(row, is_parallel)[:2]
+        if mode == "parallel_marker":
+            is_parallel = True
+        elif mode == "card":
+            is_parallel = False
+        if collect:
+            out.append((mode, vals))
+    return out
+
+
+def _time(sheet, classify):
+    # Like timeit: keep the collector from skewing the timed loop
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        _run(sheet, classify)
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500_000, help="Rows in the synthetic sheet.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the synthetic sheet.")
+    args = parser.parse_args()
+
+    sheet = synthetic_sheet(args.rows, args.seed)
+    print(f"[bench] {len(sheet):,} rows")
+
+    if _run(sheet, legacy_classify_row, collect=True) != _run(sheet, classify_row, collect=True):
+        raise SystemExit("classify_row() output differs from the legacy classifier")
+
+    legacy_elapsed = _time(sheet, legacy_classify_row)
+    single_elapsed = _time(sheet, classify_row)
+
+    for name, elapsed in (("legacy", legacy_elapsed), ("single-pass", single_elapsed)):
+        print(f"[bench] {name:<12} {elapsed:.2f}s ({len(sheet) / elapsed:,.0f} rows/sec)")
+    print(f"[bench] speedup {legacy_elapsed / single_elapsed:.1f}x, identical output")
+
+
+if __name__ == "__main__":
+    main()
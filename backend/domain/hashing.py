@@ -1,8 +1,21 @@
 #!/usr/bin/env python3
 import argparse
 import hashlib
+import json
+import logging
 import os
-from mintcastiq.serializers import serialize_for_hash
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from itertools import islice
+from typing import NamedTuple, Optional
+
+from mintcastiq.serializers import canonical_hash_payload, identity_plan
+
+logger = logging.getLogger(__name__)
 
 def hash_string(input_string: str, algorithm: str = "sha256") -> str:
     """Return the hash of the input string using the chosen algorithm."""
@@ -10,44 +23,329 @@ def hash_string(input_string: str, algorithm: str = "sha256") -> str:
     h.update(input_string.encode("utf-8"))
     return h.hexdigest()
 
-def hash_file(filepath: str, algorithm: str = "sha256") -> str:
-    """Return the hash of the file contents using the chosen algorithm."""
-    h = hashlib.new(algorithm)
-    with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            h.update(chunk)
-    return h.hexdigest()
+# Large reads keep per-chunk syscall and interpreter overhead negligible
+HASH_BUFFER_SIZE = 1024 * 1024
+
+
+def hash_file(filepath: str, algorithm: str = "sha256", cache=None) -> str:
+    """
+    Return the hash of the file contents using the chosen algorithm.
+    With a DigestCache, an unchanged file is not read at all.
+    """
+    if cache is not None:
+        return cache.hash_file(filepath, (algorithm,))[algorithm]
+    return hash_file_multi(filepath, (algorithm,))[algorithm]
+
+def hash_file_multi(filepath: str, algorithms=("sha256",), buffer_size: int = HASH_BUFFER_SIZE) -> dict:
+    """
+    Hash a file with several algorithms in one pass over its bytes.
+    Returns {algorithm: hexdigest}.
+    """
+    hashers = [hashlib.new(algorithm) for algorithm in algorithms]
+    buf = bytearray(buffer_size)
+    view = memoryview(buf)
+    with open(filepath, "rb", buffering=0) as f:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            chunk = view[:n]
+            for h in hashers:
+                h.update(chunk)
+    return {algorithm: h.hexdigest() for algorithm, h in zip(algorithms, hashers)}
+
+
+DEFAULT_DIGEST_CACHE = os.environ.get(
+    "MINTCASTIQ_DIGEST_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "mintcastiq", "digests.sqlite3"),
+)
+
+
+class DigestCache:
+    """
+    Persistent digest cache in a SQLite file, keyed by absolute path and
+    algorithm and validated against the file's (inode, size, mtime_ns).
+
+    When the stat matches, the stored digest is returned without touching
+    the file contents; otherwise the file is hashed and the entry replaced.
+    Files modified within RACY_WINDOW_NS of now are hashed but not stored,
+    since a same-size rewrite inside the same mtime tick would go unnoticed.
+    `hits` and `misses` count lookups; evict_missing() drops entries for
+    paths that no longer exist. Safe to share between threads.
+
+    Stores are committed in batches of COMMIT_EVERY, so the last batch is
+    only persisted by flush() or close(). Use the cache as a context
+    manager (`with DigestCache(path) as cache:`), which closes it on exit.
+    """
+
+    RACY_WINDOW_NS = 2 * 10 ** 9
+    COMMIT_EVERY = 100
+
+    def __init__(self, db_path: str = DEFAULT_DIGEST_CACHE):
+        self.db_path = db_path
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS file_digest (
+                path TEXT NOT NULL,
+                algorithm TEXT NOT NULL,
+                inode INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                digest TEXT NOT NULL,
+                PRIMARY KEY (path, algorithm)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def hash_file(self, filepath: str, algorithms=("sha256",), buffer_size: int = HASH_BUFFER_SIZE) -> dict:
+        """
+        {algorithm: hexdigest} for a file, from the cache when its stat matches.
+        """
+        path = os.path.abspath(filepath)
+        stat = os.stat(path)
+        digests = self.lookup(path, stat, algorithms)
+        if digests is None:
+            digests = hash_file_multi(path, algorithms, buffer_size)
+            self.store(path, stat, digests)
+        return digests
+
+    def lookup(self, path: str, stat, algorithms) -> Optional[dict]:
+        """
+        Stored digests for every algorithm if all match `stat`, else None.
+        Counts one hit or miss.
+        """
+        placeholders = ",".join("?" * len(algorithms))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT algorithm, digest FROM file_digest "
+                f"WHERE path = ? AND inode = ? AND size = ? AND mtime_ns = ? AND algorithm IN ({placeholders})",
+                (path, stat.st_ino, stat.st_size, stat.st_mtime_ns, *algorithms),
+            ).fetchall()
+            if len(rows) == len(set(algorithms)):
+                self.hits += 1
+                return dict(rows)
+            self.misses += 1
+            return None
+
+    def store(self, path: str, stat, digests: dict):
+        if time.time_ns() - stat.st_mtime_ns < self.RACY_WINDOW_NS:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO file_digest (path, algorithm, inode, size, mtime_ns, digest) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (path, algorithm, stat.st_ino, stat.st_size, stat.st_mtime_ns, digest)
+                    for algorithm, digest in digests.items()
+                ],
+            )
+            self._pending += 1
+            if self._pending >= self.COMMIT_EVERY:
+                self._commit()
+
+    def evict_missing(self) -> int:
+        """Delete entries whose path no longer exists. Returns the number of paths evicted."""
+        with self._lock:
+            paths = [row[0] for row in self._conn.execute("SELECT DISTINCT path FROM file_digest")]
+            missing = [(path,) for path in paths if not os.path.exists(path)]
+            self._conn.executemany("DELETE FROM file_digest WHERE path = ?", missing)
+            self._commit()
+        return len(missing)
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(DISTINCT path) FROM file_digest").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": entries,
+        }
+
+    def flush(self):
+        with self._lock:
+            self._commit()
+
+    def close(self):
+        self.flush()
+        self._conn.close()
+
+    def _commit(self):
+        self._conn.commit()
+        self._pending = 0
+
+
+class FileDigest(NamedTuple):
+    """One hash_tree() result. `error` is set (and digests is None) when the file couldn't be read."""
+    path: str
+    size: Optional[int]
+    digests: Optional[dict]
+    error: Optional[str] = None
+
+
+def iter_tree_files(root: str):
+    """Yield every regular file under `root` (symlinks are not followed), in sorted order."""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = sorted(os.scandir(directory), key=lambda e: e.name)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry.path
+        stack.extend(reversed(subdirs))
+
+def hash_tree(root: str, algorithms=("sha256",), workers: Optional[int] = None,
+              buffer_size: int = HASH_BUFFER_SIZE, cache: Optional[DigestCache] = None):
+    """
+    Hash every file under `root` with a thread pool, yielding FileDigest
+    records as files complete (not in path order). hashlib releases the
+    GIL while hashing large buffers, so threads hash on several cores at
+    once. At most a few files per worker are in flight, so memory stays
+    flat for arbitrarily large trees. With a DigestCache, unchanged files
+    are not read.
+    """
+    algorithms = tuple(algorithms)
+    workers = workers or min(32, (os.cpu_count() or 1) + 4)
+
+    def work(path):
+        try:
+            if cache is not None:
+                digests = cache.hash_file(path, algorithms, buffer_size)
+                return FileDigest(path, os.stat(path).st_size, digests)
+            size = os.stat(path).st_size
+            return FileDigest(path, size, hash_file_multi(path, algorithms, buffer_size))
+        except OSError as e:
+            return FileDigest(path, None, None, str(e))
+
+    files = iter_tree_files(root)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {executor.submit(work, path) for path in islice(files, workers * 4)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+            pending.update(executor.submit(work, path) for path in islice(files, len(done)))
 
 def hash_object(instance) -> str:
     """
     Generate a stable hash string for a Django model instance.
-    Uses the serialize_for_hash function to get a JSON representation.
+    Hashes the same JSON as serialize_for_hash, encoded directly by
+    canonical_hash_payload. The payload is logged at DEBUG level only.
+    """
+    payload = canonical_hash_payload(instance)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("HASH PAYLOAD: %s", payload.decode("ascii"))
+    return hashlib.sha256(payload).hexdigest()
+
+
+def hash_objects(instances):
+    """
+    Yield hash_object() of every instance in order. The per-model
+    identity plan is resolved once per model, not once per instance.
     """
-    json_str = serialize_for_hash(instance)
-    print("HASH PAYLOAD:", json_str)
-    return hashlib.sha256(json_str.encode("utf-8")).hexdigest()
+    debug = logger.isEnabledFor(logging.DEBUG)
+    sha256 = hashlib.sha256
+    model = plan = None
+    for instance in instances:
+        if type(instance) is not model:
+            model = type(instance)
+            plan = identity_plan(model)
+        payload = canonical_hash_payload(instance, plan)
+        if debug:
+            logger.debug("HASH PAYLOAD: %s", payload.decode("ascii"))
+        yield sha256(payload).hexdigest()
 
 
 def main():
-    parser = argparse.ArgumentParser(description="Hash a string or file contents.")
-    parser.add_argument("input", help="String or filename to hash")
+    parser = argparse.ArgumentParser(description="Hash a string, file contents, or a directory tree.")
+    parser.add_argument("input", help="String, filename or directory to hash")
     parser.add_argument(
         "-a", "--algorithm",
         default="sha256",
-        help="Hash algorithm (default: sha256). Options include md5, sha1, sha256, sha512, etc."
+        help="Hash algorithm (default: sha256). Options include md5, sha1, sha256, sha512, etc. "
+             "With --tree, a comma-separated list is hashed in one pass (e.g. sha256,md5)."
     )
     parser.add_argument(
         "-f", "--file",
         action="store_true",
         help="Treat input as a filename and hash its contents"
     )
+    parser.add_argument(
+        "-t", "--tree",
+        action="store_true",
+        help="Treat input as a directory and hash every file under it"
+    )
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=None,
+        help="Hashing threads for --tree (default: CPU count + 4, max 32)"
+    )
+    parser.add_argument(
+        "--cache",
+        nargs="?",
+        const=DEFAULT_DIGEST_CACHE,
+        default=None,
+        help=f"Reuse digests of unchanged files from a SQLite cache (default path: {DEFAULT_DIGEST_CACHE})"
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="With --tree, print one JSON record per file instead of tab-separated lines"
+    )
     args = parser.parse_args()
 
+    if args.tree:
+        if not os.path.isdir(args.input):
+            print(f"Directory not found: {args.input}")
+            return
+        algorithms = [a.strip() for a in args.algorithm.split(",") if a.strip()]
+        with DigestCache(args.cache) if args.cache else nullcontext() as cache:
+            for record in hash_tree(args.input, algorithms, args.workers, cache=cache):
+                if args.json:
+                    print(json.dumps(record._asdict()))
+                elif record.error:
+                    print(f"ERROR\t{record.path}\t{record.error}")
+                else:
+                    digests = "\t".join(record.digests[a] for a in algorithms)
+                    print(f"{digests}\t{record.size}\t{record.path}")
+        if cache is not None:
+            print(f"Digest cache: {cache.hits} hits, {cache.misses} misses", file=sys.stderr)
+        return
+
     if args.file:
         if not os.path.exists(args.input):
             print(f"File not found: {args.input}")
             return
-        result = hash_file(args.input, args.algorithm)
+        if args.cache:
+            with DigestCache(args.cache) as cache:
+                result = hash_file(args.input, args.algorithm, cache=cache)
+        else:
+            result = hash_file(args.input, args.algorithm)
         print(f"{args.algorithm} hash of file '{args.input}': {result}")
     else:
         result = hash_string(args.input, args.algorithm)
@@ -1,3 +1,9 @@
+import threading
+from itertools import islice
+
+from django.db import connection, transaction
+from django.utils import timezone
+
 from mintcastiq.models import (
     DimSet,
     DimCard,
@@ -5,86 +11,290 @@ from mintcastiq.models import (
     DimCardParallel,
     FactChecklistEntry,
 )
-from mintcastiq.models import StagingChecklistRow
-from mintcastiq.models.staging.staging_checklist_row import StagingChecklistRow
-from mintcastiq.models.fact_checklist_entry import FactChecklistEntry
+from mintcastiq.models.staging.staging_checklist_row import StagingChecklistRow, StagingStatus
 
 
 class ChecklistLoader:
     """
     Loads validated staging rows into canonical dimension tables.
+
+    Rows are streamed from a server-side cursor and processed set-wise in
+    fixed-size chunks: every distinct set, card, parallel and card-parallel
+    referenced by a chunk is resolved against an in-memory key -> instance
+    map (one SELECT per dimension), missing
+    dimension rows are bulk-upserted, fact entries are bulk-inserted, and
+    status, error_message and processed_at (plus the resolved FKs) are
+    written back with a single bulk_update, so each staging row is written
+    once. The number of queries per chunk is constant regardless of chunk
+    size, and memory stays flat regardless of backlog size.
+
+    Rows without a parallel are loaded against the BASE_PARALLEL dimension,
+    since every FactChecklistEntry references a card-parallel.
+
+    With `workers > 1` (PostgreSQL only) several loader threads claim chunks
+    concurrently; see _load_parallel().
     """
 
+    DEFAULT_CHUNK_SIZE = 1000
+    BASE_PARALLEL = "Base"
+    ADVISORY_LOCK_NAMESPACE = "mintcastiq.checklist_loader.set"
+    STATUS_FIELDS = ["status", "error_message", "processed_at", "set_fk", "card_fk", "parallel_fk"]
+
+    def __init__(self, chunk_size=None, workers=1):
+        self.chunk_size = chunk_size or self.DEFAULT_CHUNK_SIZE
+        self.workers = workers or 1
+
     def load_validated_rows(self):
-        rows = StagingChecklistRow.objects.filter(status="VALIDATED")
+        if self.workers > 1:
+            if connection.vendor == "postgresql":
+                return self._load_parallel()
+            print("[loader] Parallel loading needs PostgreSQL (SKIP LOCKED); loading sequentially")
 
-        for row in rows:
+        # Server-side cursor: no queryset result cache, one chunk in memory at a time
+        rows = (
+            StagingChecklistRow.objects
+            .filter(status=StagingStatus.VALIDATED)
+            .order_by("pk")
+            .iterator(chunk_size=self.chunk_size)
+        )
+
+        loaded = 0
+        while True:
+            chunk = list(islice(rows, self.chunk_size))
+            if not chunk:
+                return loaded
+            loaded += self.load_chunk(chunk)
+
+    def load_chunk(self, rows):
+        """
+        Load one chunk of staging rows. Returns the number of rows loaded.
+        """
+        try:
+            with transaction.atomic():
+                loaded = self._load_chunk(rows)
+        except Exception as e:
+            # Whole-chunk failure (e.g. a DB error): flag every row for review
+            now = timezone.now()
+            for row in rows:
+                row.status = StagingStatus.ERROR
+                row.error_message = str(e)
+                row.processed_at = now
+                # Dimension rows from the rolled-back transaction no longer exist
+                row.set_fk = row.card_fk = row.parallel_fk = None
+            loaded = 0
+
+        StagingChecklistRow.objects.bulk_update(rows, self.STATUS_FIELDS)
+        return loaded
+
+    # ----------------------------------------
+    # Parallel loading
+    # ----------------------------------------
+    def _load_parallel(self):
+        """
+        Run `workers` threads, each with its own connection, that repeatedly
+        claim a chunk of VALIDATED rows with SELECT ... FOR UPDATE SKIP LOCKED
+        and load it in its own transaction. Claimed rows stay locked until
+        their chunk commits, so no two workers ever load the same row.
+        """
+        totals = []
+        failures = []
+        lock = threading.Lock()
+
+        def worker():
+            loaded = 0
             try:
-                self._load_row(row)
-                row.status = "LOADED"
+                while True:
+                    claimed = self._claim_and_load_chunk()
+                    if claimed is None:
+                        break
+                    loaded += claimed
             except Exception as e:
-                row.status = "ERROR"
-                row.load_error = str(e)
+                failures.append(e)
+            finally:
+                connection.close()
+                with lock:
+                    totals.append(loaded)
+
+        threads = [
+            threading.Thread(target=worker, name=f"checklist-loader-{i}")
+            for i in range(self.workers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if failures:
+            raise failures[0]
+        return sum(totals)
 
-            row.save()
-            row.mark_processed()
+    def _claim_and_load_chunk(self):
+        """
+        Claim and load one chunk. Returns rows loaded, or None when no
+        unclaimed VALIDATED rows remain.
+        """
+        with transaction.atomic():
+            rows = list(
+                StagingChecklistRow.objects
+                .select_for_update(skip_locked=True)
+                .filter(status=StagingStatus.VALIDATED)
+                .order_by("pk")[:self.chunk_size]
+            )
+            if not rows:
+                return None
+
+            # Runs in a savepoint: on failure the rows stay locked and are marked ERROR
+            return self.load_chunk(rows)
+
+    def _lock_sets(self, set_names):
+        """
+        Serialize loaders touching the same set so their dimension inserts
+        cannot deadlock. Transaction-scoped advisory locks, taken in sorted
+        order with a single statement. No-op outside PostgreSQL.
+        """
+        if connection.vendor != "postgresql" or not set_names:
+            return
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_advisory_xact_lock(hashtext(x)) "
+                "FROM unnest(%s::text[]) AS x ORDER BY x",
+                [sorted(f"{self.ADVISORY_LOCK_NAMESPACE}:{name}" for name in set_names)],
+            )
 
     # ----------------------------------------
-    # Load a single staging row
+    # Chunk loading
     # ----------------------------------------
-    def _load_row(self, row):
-        data = row.normalized_row  # assuming normalized_row is a dict
+    def _load_chunk(self, rows):
+        now = timezone.now()
+        keyed = []
+
+        for row in rows:
+            row.processed_at = now
+            try:
+                keyed.append((row, self._row_keys(row)))
+            except ValueError as e:
+                row.status = StagingStatus.ERROR
+                row.error_message = str(e)
+
+        if not keyed:
+            return 0
+
+        self._lock_sets({k["set"] for _, k in keyed})
+
+        sets = self._resolve_sets({k["set"] for _, k in keyed})
+        cards = self._resolve_cards({
+            (k["set"], k["card_number"]): k for _, k in keyed
+        }, sets)
+        parallels = self._resolve_parallels({k["parallel"] for _, k in keyed})
+        card_parallels = self._resolve_card_parallels({
+            (cards[(k["set"], k["card_number"])], parallels[k["parallel"]])
+            for _, k in keyed
+        })
 
-        dim_set = self._get_or_create_set(data)
-        dim_card = self._get_or_create_card(data, dim_set)
-        dim_parallel = self._get_or_create_parallel(data)
+        facts = []
+        for row, k in keyed:
+            dim_set = sets[k["set"]]
+            dim_card = cards[(k["set"], k["card_number"])]
+            dim_parallel = parallels[k["parallel"]]
+            card_parallel = card_parallels[(dim_card.pk, dim_parallel.pk)]
 
-        if dim_parallel:
-            dim_card_parallel = self._get_or_create_card_parallel(dim_card, dim_parallel)
-        else:
-            dim_card_parallel = None
+            facts.append(self._fact_entry(row, card_parallel))
 
-        self._create_fact_entry(row, dim_card, dim_card_parallel)
+            row.set_fk = dim_set
+            row.card_fk = dim_card
+            row.parallel_fk = dim_parallel
+            row.status = StagingStatus.LOADED
+            row.error_message = None
+
+        FactChecklistEntry.objects.bulk_create(facts)
+        return len(facts)
+
+    def _row_keys(self, row):
+        raw = row.raw_row or {}
+        if not row.normalized_set:
+            raise ValueError("Missing normalized set")
+        if not row.normalized_card_number:
+            raise ValueError("Missing normalized card number")
+
+        return {
+            "set": row.normalized_set,
+            "card_number": row.normalized_card_number,
+            "player": row.normalized_player or "",
+            "team": raw.get("team_name") or raw.get("team") or "",
+            "parallel": row.normalized_parallel or self.BASE_PARALLEL,
+        }
 
     # ----------------------------------------
-    # Dimension resolvers
+    # Dimension resolvers (key -> instance maps)
+    #
+    # Existing rows are read with one SELECT; only the missing ones go
+    # through BaseIdentity.bulk_upsert(), which returns their pks and is
+    # safe against concurrent loaders inserting the same keys.
     # ----------------------------------------
-    def _get_or_create_set(self, data):
-        return DimSet.objects.get_or_create(
-            name=data["set"]
-        )[0]
-
-    def _get_or_create_card(self, data, dim_set):
-        return DimCard.objects.get_or_create(
-            set=dim_set,
-            card_number=data["card_number"],
-            defaults={
-                "player_name": data["player"],
-                "team_name": data["team"],
-            }
-        )[0]
-
-    def _get_or_create_parallel(self, data):
-        parallel = data.get("parallel")
-        if not parallel:
-            return None
-        return DimParallel.objects.get_or_create(name=parallel)[0]
-
-    def _get_or_create_card_parallel(self, dim_card, dim_parallel):
-        return DimCardParallel.objects.get_or_create(
-            card=dim_card,
-            parallel=dim_parallel
-        )[0]
+    def _resolve_sets(self, names):
+        found = {s.set_code: s for s in DimSet.objects.filter(set_code__in=names)}
+        missing = [
+            DimSet(set_code=name, set_name=name, subset_name="", sport="")
+            for name in names if name not in found
+        ]
+        for dim_set in DimSet.bulk_upsert(missing):
+            found[dim_set.set_code] = dim_set
+        return found
+
+    def _resolve_cards(self, wanted, sets):
+        set_ids = {sets[set_name].pk for set_name, _ in wanted}
+        numbers = {number for _, number in wanted}
+        by_pk = {s.pk: name for name, s in sets.items()}
+
+        found = {
+            (by_pk[c.cardset_id], c.card_number): c
+            for c in DimCard.objects.filter(cardset_id__in=set_ids, card_number__in=numbers)
+            if (by_pk[c.cardset_id], c.card_number) in wanted
+        }
+        missing = {
+            key: DimCard(cardset=sets[key[0]], card_number=key[1], name=k["player"], team_name=k["team"])
+            for key, k in wanted.items() if key not in found
+        }
+        DimCard.bulk_upsert(missing.values())
+        found.update(missing)
+        return found
+
+    def _resolve_parallels(self, names):
+        found = {p.parallel_name: p for p in DimParallel.objects.filter(parallel_name__in=names)}
+        # Parallels are shared across sets; insert in a stable order to avoid deadlocks
+        missing = [DimParallel(parallel_name=name) for name in sorted(names) if name not in found]
+        for parallel in DimParallel.bulk_upsert(missing):
+            found[parallel.parallel_name] = parallel
+        return found
+
+    def _resolve_card_parallels(self, pairs):
+        card_ids = {card.pk for card, _ in pairs}
+        parallel_ids = {parallel.pk for _, parallel in pairs}
+        wanted = {(card.pk, parallel.pk) for card, parallel in pairs}
+
+        found = {
+            (cp.card_id, cp.parallel_id): cp
+            for cp in DimCardParallel.objects.filter(card_id__in=card_ids, parallel_id__in=parallel_ids)
+            if (cp.card_id, cp.parallel_id) in wanted
+        }
+        missing = [
+            DimCardParallel(card=card, parallel=parallel)
+            for card, parallel in pairs if (card.pk, parallel.pk) not in found
+        ]
+        for card_parallel in DimCardParallel.bulk_upsert(missing):
+            found[(card_parallel.card_id, card_parallel.parallel_id)] = card_parallel
+        return found
 
     # ----------------------------------------
     # Fact table
     # ----------------------------------------
-    def _create_fact_entry(self, row, dim_card, dim_card_parallel):
-        FactChecklistEntry.objects.create(
-            card=dim_card,
-            card_parallel=dim_card_parallel,
-            source_file=row.source_file,
-            source_sheet=row.source_sheet,
-            source_row=row.row_number,
-            raw_data=row.raw_row,
-        )
\ No newline at end of file
+    def _fact_entry(self, row, card_parallel):
+        raw = row.raw_row or {}
+        return FactChecklistEntry(
+            card_parallel=card_parallel,
+            source_file=raw.get("_file") or "",
+            source_sheet=raw.get("_sheet"),
+            source_row=raw.get("_row") or 0,
+            raw_data=raw,
+        )
@@ -1,10 +1,34 @@
+from decimal import Decimal
+from itertools import repeat
+from operator import itemgetter
+
+
+NUMERIC_TYPES = {bool, int, float, Decimal}
+
+
 class ChecklistNormalizationService:
     """
     Normalizes contributor-provided checklist rows into canonical,
     audit-safe values. This service never mutates raw input and
     writes all normalized fields back to the staging row.
+
+    For bulk work use `run_batch()` (list of raw rows) or `run_columns()`
+    (column arrays): fields are normalized column by column with each
+    distinct value normalized once, and per-row errors are collected in a
+    side array instead of raised. `run_columns()` is the fastest path since
+    it skips building a dict per row. `run_staging()` is what the staging
+    paths of IngestDispatcher use; its column arrays go straight to
+    StagingWriter.write_columns().
     """
 
+    # (normalized field, raw column, normalizer) in the order run() applies them
+    FIELDS = (
+        ("set", "set_name", "normalize_set"),
+        ("card_number", "card_number", "normalize_card_number"),
+        ("player", "player_name", "normalize_player"),
+        ("parallel", "parallel", "normalize_parallel"),
+    )
+
     def __init__(self, raw_row: dict):
         self.raw = raw_row  # or staging_row.raw if that's the field name 
         self.normalized = {}
@@ -21,12 +45,126 @@ class ChecklistNormalizationService:
 
         except Exception as e:
             raise e
-        
+
+    # -----------------------------
+    # Batch / columnar API
+    # -----------------------------
+
+    @classmethod
+    def run_batch(cls, raw_rows, as_columns=False):
+        """
+        Normalize a list of raw rows.
+        Returns (normalized, errors), both aligned with `raw_rows`:
+        normalized[i] is the dict run() would return (None if the row
+        failed) and errors[i] is the first error message (None if it passed).
+
+        With `as_columns=True` the per-row dicts are not built: normalized
+        is run_columns()' {field: values} (failed cells hold None).
+        """
+        raw_rows = list(raw_rows)
+        columns = {
+            raw_col: [row.get(raw_col) for row in raw_rows]
+            for _, raw_col, _ in cls.FIELDS
+        }
+        normalized_columns, errors = cls.run_columns(columns)
+        if as_columns:
+            return normalized_columns, errors
+
+        names = [field for field, _, _ in cls.FIELDS]
+        normalized = list(map(
+            dict, map(zip, repeat(names), zip(*(normalized_columns[name] for name in names)))
+        ))
+        for i, error in enumerate(errors):
+            if error is not None:
+                normalized[i] = None
+        return normalized, errors
+
+    @classmethod
+    def run_staging(cls, raw_rows):
+        """
+        Normalized values for the staging table as {field: values}
+        columns aligned with `raw_rows`. Unlike run_batch() a row that
+        fails keeps the fields that did normalize (failed ones are None):
+        the row is staged anyway and ChecklistValidationService reports
+        what is missing.
+        """
+        columns, _ = cls.run_batch(raw_rows, as_columns=True)
+        return columns
+
+    @classmethod
+    def run_columns(cls, columns):
+        """
+        Normalize column arrays keyed by raw column name (set_name,
+        card_number, player_name, parallel); missing columns count as empty.
+        Returns ({normalized field: values}, errors) where a failed cell
+        holds None and errors[i] is the row's first error message.
+        """
+        length = max((len(values) for values in columns.values()), default=0)
+        errors = [None] * length
+        out = {}
+
+        for field, raw_col, method in cls.FIELDS:
+            normalize = getattr(cls, method)
+            values = columns.get(raw_col) or [None] * length
+            out[field] = cls._normalize_column(normalize, values, errors)
+
+        return out, errors
+
+    @staticmethod
+    def _normalize_column(normalize, values, errors):
+        """
+        Normalize each distinct value once, then map the column through the
+        results. Checklists repeat set / player / parallel names heavily, so
+        the Python-level work is proportional to distinct values, not rows.
+        """
+        keys = values
+        unkey = None
+        try:
+            distinct = dict.fromkeys(keys)
+        except TypeError:
+            distinct = None  # unhashable cells: fall back to per-cell work
+
+        # 1, 1.0 and True hash alike but normalize differently; only pay for
+        # (type, value) keys when a column actually mixes numeric types
+        if distinct is not None and any(type(key) in NUMERIC_TYPES for key in distinct):
+            if len(set(map(type, values)) & NUMERIC_TYPES) > 1:
+                keys = list(zip(map(type, values), values))
+                unkey = itemgetter(1)
+                distinct = dict.fromkeys(keys)
+
+        if distinct is None:
+            results = []
+            for i, value in enumerate(values):
+                try:
+                    results.append(normalize(value))
+                except Exception as e:
+                    results.append(None)
+                    if errors[i] is None:
+                        errors[i] = str(e)
+            return results
+
+        failed = {}
+        for key in distinct:
+            try:
+                distinct[key] = normalize(unkey(key) if unkey else key)
+            except Exception as e:
+                failed[key] = str(e)
+
+        results = list(map(distinct.__getitem__, keys))
+
+        if failed:
+            for i, key in enumerate(keys):
+                if errors[i] is None and key in failed:
+                    errors[i] = failed[key]
+
+        return results
+
     # -----------------------------
     # Normalization helpers
     # -----------------------------
 
-    def normalize_set(self, value):
+    @staticmethod
+    def normalize_set(value):
         if not value:
             raise ValueError("Missing set name")
 
@@ -35,7 +173,8 @@ class ChecklistNormalizationService:
         # Example: "2025 topps baseball" → "2025 Topps Baseball"
         return cleaned
 
-    def normalize_card_number(self, value):
+    @staticmethod
+    def normalize_card_number(value):
         if not value:
             raise ValueError("Missing card number")
 
@@ -44,7 +183,8 @@ class ChecklistNormalizationService:
         # Example: "  23a " → "23A"
         return cleaned
 
-    def normalize_player(self, value):
+    @staticmethod
+    def normalize_player(value):
         if not value:
             raise ValueError("Missing player name")
 
@@ -53,7 +193,8 @@ class ChecklistNormalizationService:
         # Example: "mike trout" → "Mike Trout"
         return cleaned
 
-    def normalize_parallel(self, value):
+    @staticmethod
+    def normalize_parallel(value):
         if not value:
             return None  # parallels are optional
 
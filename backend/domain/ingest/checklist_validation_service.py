@@ -1,8 +1,38 @@
+from itertools import islice
+
+from django.utils import timezone
+
+from mintcastiq.models.staging.staging_checklist_row import StagingChecklistRow, StagingStatus
+
+
+class ValidationReferences:
+    """
+    Reference vocabularies a validation run checks rows against, loaded
+    once per run into immutable in-memory sets.
+    """
+
+    def __init__(self, parallels=()):
+        self.parallels = frozenset(parallels)
+
+    @classmethod
+    def load(cls):
+        from mintcastiq.models import DimParallel
+
+        return cls(
+            parallels=DimParallel.objects.values_list("parallel_name", flat=True),
+        )
+
+
 class ChecklistValidationService:
     """
     Validates a normalized staging row.
     Ensures required fields are present and logically consistent.
     Writes validation errors back to the staging row.
+
+    For bulk work use `validate_chunk()` / `validate_pending()`: reference
+    vocabularies are preloaded once (see ValidationReferences) and each
+    chunk is written back with a single bulk_update, so a run costs a
+    constant number of queries per chunk instead of two per row.
     """
 
     REQUIRED_FIELDS = [
@@ -11,22 +41,85 @@ class ChecklistValidationService:
         "normalized_player",
     ]
 
-    def __init__(self, staging_row):
+    DEFAULT_CHUNK_SIZE = 1000
+    STATUS_FIELDS = ["status", "error_message", "processed_at"]
+
+    def __init__(self, staging_row, references=None):
         self.row = staging_row
+        # Optional ValidationReferences; without it lookups hit the database
+        self.references = references
         self.errors = []
 
     def run(self):
+        self.validate()
+        self.row.save(update_fields=self.STATUS_FIELDS)
+
+    def validate(self):
+        """
+        Run every check and set status/error_message on the row without
+        saving it. Returns the list of errors.
+        """
         self._check_required_fields()
         self._check_card_number()
         self._check_parallel()
 
+        self.row.processed_at = timezone.now()
         if self.errors:
-            self.row.validation_errors = self.errors
-            self.row.status = "ERROR"
+            self.row.error_message = "; ".join(self.errors)
+            self.row.status = StagingStatus.ERROR
         else:
-            self.row.status = "VALIDATED"
+            self.row.error_message = None
+            self.row.status = StagingStatus.VALIDATED
 
-        self.row.save()
+        return self.errors
+
+    # ----------------------------------------
+    # Batch validation
+    # ----------------------------------------
+
+    @classmethod
+    def validate_chunk(cls, rows, references=None):
+        """
+        Validate a chunk of staging rows against preloaded references and
+        write them back with one bulk_update. Returns the number of rows
+        that passed.
+        """
+        rows = list(rows)
+        if not rows:
+            return 0
+
+        if references is None:
+            references = ValidationReferences.load()
+
+        passed = sum(not cls(row, references).validate() for row in rows)
+        StagingChecklistRow.objects.bulk_update(rows, cls.STATUS_FIELDS)
+        return passed
+
+    @classmethod
+    def validate_pending(cls, chunk_size=None):
+        """
+        Validate every PENDING staging row in chunks. References are loaded
+        once for the whole run. Returns (validated, errors).
+        """
+        chunk_size = chunk_size or cls.DEFAULT_CHUNK_SIZE
+        references = ValidationReferences.load()
+
+        # Server-side cursor: one chunk in memory at a time
+        rows = (
+            StagingChecklistRow.objects
+            .filter(status=StagingStatus.PENDING)
+            .order_by("pk")
+            .iterator(chunk_size=chunk_size)
+        )
+
+        validated = failed = 0
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                return validated, failed
+            passed = cls.validate_chunk(chunk, references)
+            validated += passed
+            failed += len(chunk) - passed
 
     # ----------------------------------------
     # Validation checks
@@ -54,7 +147,12 @@ class ChecklistValidationService:
             return
 
         # Example: check against known parallels
-        from mintcastiq.models import DimParallel
+        if self.references is not None:
+            known = parallel in self.references.parallels
+        else:
+            from mintcastiq.models import DimParallel
+
+            known = DimParallel.objects.filter(parallel_name=parallel).exists()
 
-        if not DimParallel.objects.filter(name=parallel).exists():
+        if not known:
             self.errors.append(f"Unknown parallel: {parallel}")
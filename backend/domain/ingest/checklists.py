@@ -1,7 +1,15 @@
 import os, json, openpyxl, yaml
+import argparse
+import multiprocessing
+import queue
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import logging
 from datetime import datetime
 import importlib
+from types import MappingProxyType
+from typing import Callable, NamedTuple, Optional
 from domain.hashing import hash_string, hash_file
 
 STAGING_DIR = "staging"
@@ -263,224 +271,880 @@ def resolve_columns(sheet_def, column_sets, meta, defaults, row_type="cards"):
         else:
             return defaults["columns"].get(row_type, {})
 
-def build(row, col_map, meta) -> dict:
-    # Build value objects for richer representation
-    vals = {field_name: safe_get(row, idx) for idx, field_name in col_map.items()}
+# Row type -> column section used to resolve its columns
+ROW_TYPE_SECTIONS = {
+    "subset": "subset",
+    "parallel": "parallel",
+    "card": "cards",
+    "master": "cards",
+}
 
-    # Canonical key always starts with meta
-    key_parts = [meta.get("year"), meta.get("brand"), meta.get("set_name")]
-    for field in ("subset_name", "parallel_name", "card_number"):
-        if vals.get(field):
-            key_parts.append(vals[field])
+# Fields that make up a record key, in key order
+KEY_FIELDS = ("subset_name", "parallel_name", "card_number")
 
-    k = "-".join(map(str, key_parts))
+# Cells classify_row() needs to decide a row's type
+CLASSIFY_WIDTH = 5
 
-    # Try to use Django model classes if available, otherwise fall back
-    try:
-        from mintcastiq.models import DimSet as ModelDimSet, DimCard as ModelDimCard, DimParallel as ModelDimParallel
-    except Exception:
-        ModelDimSet = ModelDimCard = ModelDimParallel = None
-
-    # Decide which model object to build (do NOT save to DB here)
-    # Map fields from meta/vals into model constructor kwargs
-    if vals.get("card_number"):
-        # build a DimCard-like object
-        card_kwargs = {
-            "name": vals.get("player_name") or vals.get("parallel_name") or "",
-            "team_name": vals.get("team_name"),
-            "card_number": vals.get("card_number"),
-            "cardset": None,
-        }
-        if ModelDimCard:
-            obj = ModelDimCard(**card_kwargs)
-            setattr(obj, "parallel", None)
-        else:
-            # fallback lightweight object that mirrors earlier meta/vals merging
-            class DimCard:
-                def __init__(self, meta, vals):
-                    self.meta = dict(meta)
-                    self.vals = dict(vals)
-                    self.cardset = None
-                    self.parallel = None
-
-                def to_dict(self):
-                    out = {**self.meta, **self.vals}
-                    out["parallel"] = None
-                    if self.cardset is not None:
-                        out["cardset"] = self.cardset.to_dict() if hasattr(self.cardset, "to_dict") else self.cardset
-                    return out
-
-            obj = DimCard(meta, vals)
-    elif vals.get("parallel_name") and not vals.get("card_number"):
-        parallel_kwargs = {
-            "parallel_name": vals.get("parallel_name"),
-            "print_run": vals.get("print_run") if vals.get("print_run") else None,
-            "cardset": None,
+
+class ColumnPlan(NamedTuple):
+    """
+    Resolved columns for one row type: the cell indexes to read and the
+    field each one fills, in config order, plus the positions (within
+    `fields`) of the fields build() inspects. A field mapped twice resolves
+    to its last position, as it would in a dict.
+    """
+    indexes: tuple
+    fields: tuple
+    key_positions: tuple  # positions of KEY_FIELDS present, in key order
+    card_pos: Optional[int]
+    parallel_pos: Optional[int]
+
+    @classmethod
+    def compile(cls, col_map):
+        fields = tuple(col_map.values())
+        last = {field: pos for pos, field in enumerate(fields)}
+        return cls(
+            indexes=tuple(col_map.keys()),
+            fields=fields,
+            key_positions=tuple(last[f] for f in KEY_FIELDS if f in last),
+            card_pos=last.get("card_number"),
+            parallel_pos=last.get("parallel_name"),
+        )
+
+
+class ChecklistRecord:
+    """
+    Compact record for one checklist row: the row's values as a tuple,
+    named by the shared ColumnPlan, plus a reference to its subset record
+    (never a copy). Checklist meta is kept once per result, not per record.
+    """
+    __slots__ = ("columns", "values", "cardset")
+
+    def __init__(self, columns, values):
+        self.columns = columns
+        self.values = values
+        self.cardset = None
+
+    @property
+    def vals(self):
+        return dict(zip(self.columns.fields, self.values))
+
+    def to_dict(self):
+        out = self.vals
+        out["cardset"] = self.cardset.key if self.cardset is not None else None
+        return out
+
+
+class ChecklistSet(ChecklistRecord):
+    """
+    Subset / generic set record. Interned per workbook by `key`, which is
+    also the id cards and parallels use to point at it.
+    """
+    __slots__ = ("key",)
+
+    def __init__(self, columns, values, key):
+        super().__init__(columns, values)
+        self.key = key
+
+
+class ChecklistCard(ChecklistRecord):
+    __slots__ = ("parallel",)
+
+    def __init__(self, columns, values):
+        super().__init__(columns, values)
+        self.parallel = None
+
+    def to_dict(self):
+        out = self.vals
+        out["parallel"] = None
+        out["cardset"] = self.cardset.key if self.cardset is not None else None
+        return out
+
+
+class ChecklistParallel(ChecklistRecord):
+    __slots__ = ()
+
+
+class SheetPlan(NamedTuple):
+    """
+    Immutable, precompiled form of one sheet definition. Built once per
+    sheet by compile_sheet_plan(); build() only does tuple lookups on it.
+    """
+    name: str
+    key_prefix: str
+    width: int  # cells to extract per row: every planned index + classify_row's
+    columns: MappingProxyType  # row type -> ColumnPlan
+    new_set: Callable
+    new_card: Callable
+    new_parallel: Callable
+
+    def __reduce__(self):
+        # mappingproxy can't be pickled: store a plain dict and re-wrap on load
+        return _restore_sheet_plan, tuple(self._replace(columns=dict(self.columns)))
+
+
+def _restore_sheet_plan(*fields):
+    plan = SheetPlan(*fields)
+    return plan._replace(columns=MappingProxyType(plan.columns))
+
+
+def compile_sheet_plan(sheet_def, cfg, defaults=None) -> SheetPlan:
+    """
+    Resolve the columns of every row type for `sheet_def` once.
+    """
+    meta = cfg.get("meta", {})
+    column_sets = cfg.get("column_sets", {})
+    defaults = cfg.get("defaults") or defaults or {"columns": {}}
+
+    columns = {}
+    for row_type, section in ROW_TYPE_SECTIONS.items():
+        col_map = resolve_columns(sheet_def, column_sets, meta, defaults, section)
+        columns[row_type] = ColumnPlan.compile(col_map)
+
+    indexes = [idx for plan in columns.values() for idx in plan.indexes]
+
+    return SheetPlan(
+        name=sheet_def["name"],
+        width=max([CLASSIFY_WIDTH - 1, *indexes]) + 1,
+        key_prefix="-".join(map(str, (meta.get("year"), meta.get("brand"), meta.get("set_name")))),
+        columns=MappingProxyType(columns),
+        new_set=ChecklistSet,
+        new_card=ChecklistCard,
+        new_parallel=ChecklistParallel,
+    )
+
+def compile_checklist(cfg, defaults=None) -> dict:
+    """
+    Compile every sheet of a checklist config, keyed by lower-cased sheet name.
+    """
+    plans = {}
+    for sheet_def in cfg.get("sheets", {}).values():
+        plans.setdefault(sheet_def["name"].lower(), compile_sheet_plan(sheet_def, cfg, defaults))
+    return plans
+
+class CompiledChecklist(NamedTuple):
+    key: str
+    cfg: dict
+    plans: dict  # lower-cased sheet name -> SheetPlan
+
+
+class ChecklistConfigRegistry:
+    """
+    Parsed, validated and compiled view of checklists.yaml.
+
+    The YAML is parsed and validated once and compiled into O(1) lookup
+    tables: checklists by workbook filename (with or without .xlsx, or the
+    meta source_file) and SheetPlans by lower-cased sheet name. The
+    validated config is cached on disk next to the config as plain JSON
+    data, keyed by the file's sha256 and mtime, so other processes skip
+    YAML parsing and validation; SheetPlans are recompiled from it, which
+    is cheap. The cache never holds anything executable.
+
+    Lookups re-stat the file at most once per `check_interval` seconds and
+    recompile when it changed, so long-running workers pick up config edits
+    without restarting. An edit that fails validation is logged and the
+    last good config stays in use.
+
+    Pass `config` instead of `path` to compile an in-memory config; it is
+    validated once and never reloaded.
+    """
+
+    CACHE_VERSION = 2
+
+    def __init__(self, path=None, cache_path=None, check_interval=1.0, config=None):
+        self.path = path
+        self.cache_path = cache_path or (f"{path}.compiled" if path else None)
+        self.check_interval = check_interval
+        self.config = {}
+        self._checklists = {}
+        self._stat = None
+        self._checked_at = 0.0
+
+        if path is not None:
+            self.refresh(force=True)
+        elif config is not None:
+            if not validate_config(config):
+                raise RuntimeError("Checklist config validation failed")
+            self._install(config, self._compile(config))
+
+    # ----------------------------------------
+    # Lookups
+    # ----------------------------------------
+    def checklist(self, filename):
+        """
+        CompiledChecklist for a workbook filename, or None.
+        """
+        self.refresh()
+        return self._checklists.get(filename)
+
+    def sheet_plan(self, filename, sheetname):
+        compiled = self.checklist(filename)
+        if compiled is None:
+            return None
+        return compiled.plans.get(sheetname.lower())
+
+    # ----------------------------------------
+    # Loading
+    # ----------------------------------------
+    def refresh(self, force=False) -> bool:
+        """
+        Recompile if the config file changed. Returns True when a new
+        config was installed.
+        """
+        if self.path is None:
+            return False
+
+        now = time.monotonic()
+        if not force and now - self._checked_at < self.check_interval:
+            return False
+        self._checked_at = now
+
+        try:
+            stat = os.stat(self.path)
+        except OSError as e:
+            # Editors may replace the file non-atomically; keep serving the
+            # previous config until it is back
+            if self._stat is None:
+                raise
+            logging.error(f"Checklist config unavailable, keeping previous config: {e}")
+            return False
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp == self._stat:
+            return False
+
+        try:
+            self._reload(stat.st_mtime_ns)
+        except Exception as e:
+            if self._stat is None:
+                raise
+            logging.error(f"Checklist config reload failed, keeping previous config: {e}")
+            return False
+        finally:
+            # Don't retry a broken edit until the file changes again
+            self._stat = stamp
+
+        logging.info(f"Loaded checklist config from {self.path}")
+        return True
+
+    def _reload(self, mtime_ns):
+        digest = hash_file(self.path)
+        cfg = self._read_cache(digest, mtime_ns)
+        if cfg is not None:
+            try:
+                self._install(cfg, self._compile(cfg))
+                return
+            except Exception as e:
+                logging.warning(f"Ignoring invalid checklist config cache {self.cache_path}: {e}")
+
+        cfg = load_config(self.path)  # parses + validates
+        checklists = self._compile(cfg)
+        self._write_cache(digest, mtime_ns, cfg)
+        self._install(cfg, checklists)
+
+    def _install(self, cfg, checklists):
+        self.config = cfg
+        self._checklists = checklists
+
+    @staticmethod
+    def _compile(cfg):
+        defaults = cfg.get("defaults")
+        checklists = {}
+        for key, checklist_cfg in cfg.items():
+            # Top-level entries without sheets (e.g. "defaults") aren't checklists
+            if not isinstance(checklist_cfg, dict) or "sheets" not in checklist_cfg:
+                continue
+
+            compiled = CompiledChecklist(key, checklist_cfg, compile_checklist(checklist_cfg, defaults))
+            source_file = checklist_cfg.get("meta", {}).get("source_file")
+            for name in (key, f"{key}.xlsx", source_file):
+                if name:
+                    checklists.setdefault(name, compiled)
+        return checklists
+
+    # ----------------------------------------
+    # On-disk cache
+    # ----------------------------------------
+    #
+    # Plain JSON only. Mappings are stored as {"items": [[key, value], ...]}
+    # so YAML's int keys (sheet and column indexes) survive the round trip.
+    # ----------------------------------------
+    def _read_cache(self, digest, mtime_ns):
+        """
+        The cached validated config dict, or None on a miss.
+        """
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f, object_hook=self._decode_mapping)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.warning(f"Ignoring unreadable checklist config cache {self.cache_path}: {e}")
+            return None
+
+        if not isinstance(cached, dict) or (
+            cached.get("version"), cached.get("digest"), cached.get("mtime_ns")
+        ) != (self.CACHE_VERSION, digest, mtime_ns):
+            return None
+        cfg = cached.get("config")
+        return cfg if isinstance(cfg, dict) else None
+
+    def _write_cache(self, digest, mtime_ns, cfg):
+        payload = {
+            "version": self.CACHE_VERSION,
+            "digest": digest,
+            "mtime_ns": mtime_ns,
+            "config": cfg,
         }
-        if ModelDimParallel:
-            obj = ModelDimParallel(**parallel_kwargs)
-        else:
-            class DimParallel:
-                def __init__(self, meta, vals):
-                    self.meta = dict(meta)
-                    self.vals = dict(vals)
-                    self.cardset = None
-
-                def to_dict(self):
-                    out = {**self.meta, **self.vals}
-                    if self.cardset is not None:
-                        out["cardset"] = self.cardset.to_dict() if hasattr(self.cardset, "to_dict") else self.cardset
-                    return out
-
-            obj = DimParallel(meta, vals)
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._encode_mappings(payload), f, separators=(",", ":"))
+            # Atomic swap: concurrent readers see the old or new cache, never half
+            os.replace(tmp_path, self.cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            # TypeError/ValueError: YAML values JSON can't hold (e.g. dates)
+            logging.warning(f"Could not write checklist config cache {self.cache_path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    @classmethod
+    def _encode_mappings(cls, value):
+        if isinstance(value, dict):
+            return {"items": [[k, cls._encode_mappings(v)] for k, v in value.items()]}
+        if isinstance(value, list):
+            return [cls._encode_mappings(v) for v in value]
+        return value
+
+    @staticmethod
+    def _decode_mapping(obj):
+        return {k: v for k, v in obj["items"]}
+
+def resolve_checklist(all_cfg, filename):
+    """
+    (cfg, plans) for a workbook, from a ChecklistConfigRegistry or a plain
+    top-level config dict (compiled on the fly). (None, None) when the
+    workbook has no checklist config.
+    """
+    if isinstance(all_cfg, ChecklistConfigRegistry):
+        compiled = all_cfg.checklist(filename)
+        cfg, plans = (compiled.cfg, compiled.plans) if compiled else (None, None)
     else:
-        # subset / generic set
-        set_kwargs = {
-            "set_name": meta.get("set_name"),
-            "publisher": meta.get("brand"),
-            "set_year": str(meta.get("year")) if meta.get("year") else None,
-            "subset_name": vals.get("subset_name"),
-            "print_run": vals.get("print_run") if vals.get("print_run") else None,
-            "friendly_name": f"{meta.get('year')}-{meta.get('brand')}-{meta.get('set_name')}",
-        }
-        if ModelDimSet:
-            obj = ModelDimSet(**set_kwargs)
-        else:
-            class DimSet:
-                def __init__(self, meta, vals):
-                    self.meta = dict(meta)
-                    self.vals = dict(vals)
+        cfg = all_cfg.get(filename.replace(".xlsx", ""))
+        plans = compile_checklist(cfg, all_cfg.get("defaults")) if cfg else None
 
-                def to_dict(self):
-                    return {**self.meta, **self.vals}
+    if not cfg:
+        logging.warning(f"No checklist config for {filename}")
+        return None, None
+    return cfg, plans
 
-            obj = DimSet(meta, vals)
+def build(cells, columns, plan):
+    """
+    Build the record for a row from its classify_row() cells (padded to
+    plan.width) and its ColumnPlan. Returns (key, record).
+    Records are plain objects; nothing is written to the DB here.
+    """
+    values = tuple([cells[idx] for idx in columns.indexes])
 
-    return {k: obj}
+    # Canonical key always starts with meta
+    k = plan.key_prefix
+    for pos in columns.key_positions:
+        if values[pos]:
+            k += "-" + values[pos]
+
+    if columns.card_pos is not None and values[columns.card_pos]:
+        return k, plan.new_card(columns, values)
+    if columns.parallel_pos is not None and values[columns.parallel_pos]:
+        return k, plan.new_parallel(columns, values)
+    # subset / generic set
+    return k, plan.new_set(columns, values, k)
+
+def classify_row(row, is_parallel, width=CLASSIFY_WIDTH):
+    """
+    Decide the row type in a single pass: the first CLASSIFY_WIDTH cells are
+    read and stripped once into a tuple, padded with "" so it covers `width`
+    cells (same values safe_get() would return for each index).
+    Returns (mode, vals, cells); `cells` lets build() skip re-reading the
+    row, and is empty when the first cell is blank.
+    """
+    # Empty first cell: nothing else matters
+    if not row or row[0] is None:
+        return "unknown", {}, ()
+
+    width = max(width, CLASSIFY_WIDTH)
+    if len(row) < width:
+        row = tuple(row) + (None,) * (width - len(row))
 
-def classify_row(row, is_parallel):
-        # Parallel marker row should be detected before subset rows
-        first_col = (safe_get(row, 0) or "").strip()
-        if not first_col:
-            return "unknown", {}
-        elif "parallel" in first_col.lower():
-            return "parallel_marker", {"parallel_name": safe_get(row, 0)}
+    v0, v1, v2, v3, v4 = row[:CLASSIFY_WIDTH]
+    c0 = str(v0).strip()
+    if not c0:
+        return "unknown", {}, ()
 
-        # Parallel rows: only col0 populated, in parallel mode
-        elif safe_get(row, 0) and not safe_get(row, 1) and not safe_get(row, 2) and is_parallel:
-            return "parallel", {"parallel_name": safe_get(row, 0)}
+    c1 = "" if v1 is None else str(v1).strip()
+    c2 = "" if v2 is None else str(v2).strip()
+    c3 = "" if v3 is None else str(v3).strip()
+    c4 = "" if v4 is None else str(v4).strip()
+    cells = (c0, c1, c2, c3, c4)
+    if width > CLASSIFY_WIDTH:
+        cells += tuple(["" if v is None else str(v).strip() for v in row[CLASSIFY_WIDTH:width]])
 
-        # Subset rows: only col0 populated, not in parallel mode
-        elif safe_get(row, 0) and not safe_get(row, 1) and not safe_get(row, 2) and not is_parallel:
-            return "subset", {"subset_name": safe_get(row, 0)}
+    # Parallel marker row should be detected before subset rows
+    if "parallel" in c0.lower():
+        return "parallel_marker", {"parallel_name": c0}, cells
 
+    # Only col0 populated: a parallel in parallel mode, otherwise a subset
+    if not c1 and not c2:
+        if is_parallel:
+            return "parallel", {"parallel_name": c0}, cells
+        return "subset", {"subset_name": c0}, cells
+
+    if c1 and c2:
         # Master rows: card fields + extras
-        elif safe_get(row, 1) and safe_get(row, 2) and safe_get(row, 3) and safe_get(row, 4):
+        if c3 and c4:
             return "master", {
-                "card_number": safe_get(row, 1),
-                "player_name": safe_get(row, 2),
-                "team_name": safe_get(row, 3),
-                "print_run": safe_get(row, 4),
-            }
+                "card_number": c1,
+                "player_name": c2,
+                "team_name": c3,
+                "print_run": c4,
+            }, cells
 
         # Card rows: basic card fields
-        elif safe_get(row, 1) and safe_get(row, 2):
-            return "card", {
-                "card_number": safe_get(row, 1),
-                "player_name": safe_get(row, 2),
-                "team_name": safe_get(row, 3),
-            }
+        return "card", {
+            "card_number": c1,
+            "player_name": c2,
+            "team_name": c3,
+        }, cells
 
-        else:
-            return "unknown", {}
+    return "unknown", {}, cells
 
-def ingest_checklist(ws, filename, sheetname, cfg):
-    meta = cfg.get("meta", {})
-    sheets = cfg.get("sheets", {})
-    column_sets = cfg.get("column_sets", {})
-    defaults = cfg.get("defaults", {})
-
-    sheet_def = next((s for s in sheets.values() if s["name"].lower() == sheetname.lower()), None)
-    if not sheet_def:
-        logging.warning(f"No config for sheet {sheetname}, skipping")
-        return {"cards": {}, "parallels": {}}
+def iter_sheet(ws, plan, subsets=None):
+    """
+    Stream a worksheet through the classify_row state machine using a
+    compiled SheetPlan. Yields ("subsets" | "cards" | "parallels", key,
+    record) one result at a time, so a read-only worksheet is processed
+    without holding its rows in memory.
 
-    rows = list(ws.iter_rows(values_only=True))
+    Subset records are interned in `subsets` (key -> ChecklistSet, shared
+    across the sheets of a workbook) and only yielded the first time a key
+    is seen; cards and parallels reference them instead of copying them.
+    """
+    if subsets is None:
+        subsets = {}
+    columns = plan.columns
+    width = plan.width
     is_parallel = False
 
     # --- Outer loop ---
     current_subset = None
-    parallels = {}
-    cards = {}
 
-    for row in rows:
-        mode, vals = classify_row(row, is_parallel)
+    for row in ws.iter_rows(values_only=True):
+        mode, vals, cells = classify_row(row, is_parallel, width)
 
         if mode == "parallel_marker":
             is_parallel = True
             continue
+        elif mode == "unknown":
+            continue
         elif mode == "card":
             is_parallel = False  # flip back out of parallel mode
-        col_map = resolve_columns(sheet_def, column_sets, meta, defaults, mode)
-        artifact = build(row, col_map, meta)
+        k, record = build(cells, columns[mode], plan)
 
         if mode == "subset":
-            # store the DimSet instance (first/only value)
-            current_subset = next(iter(artifact.values()))
-            # normalize to a serializable dict for later attachment
-            current_subset = current_subset.to_dict() if hasattr(current_subset, "to_dict") else current_subset
-
-        elif mode == "parallel":
-            for k, v in artifact.items():
-                # v is a DimParallel instance — attach cardset and serialize
-                if current_subset is not None:
-                    v.cardset = current_subset
-                d = v.to_dict() if hasattr(v, "to_dict") else v
-                if "cardset" not in d:
-                    d["cardset"] = current_subset if current_subset is not None else None
-                parallels.update({k: d})
-
-        elif mode in ("card", "master"):
-            for k, v in artifact.items():
-                if current_subset is not None:
-                    v.cardset = current_subset
-                d = v.to_dict() if hasattr(v, "to_dict") else v
-                if "cardset" not in d:
-                    d["cardset"] = current_subset if current_subset is not None else None
-                cards.update({k: d})
-
-    return {"cards": cards, "parallels": parallels}
+            current_subset = subsets.get(k)
+            if current_subset is None:
+                current_subset = subsets[k] = record
+                yield "subsets", k, record
+            continue
 
-def ingest_workbook(wb, filename, all_cfg):
+        record.cardset = current_subset
+        yield ("parallels" if mode == "parallel" else "cards"), k, record
+
+def iter_checklist(ws, filename, sheetname, cfg, plans=None, subsets=None, defaults=None):
     """
-    Process a workbook using the top-level checklists configuration `all_cfg`.
-    `all_cfg` maps checklist keys (filename without .xlsx) to per-checklist configs.
+    Stream one worksheet. `plans` is the compile_checklist() output for
+    `cfg`; it is compiled here (with the top-level `defaults`) when not given.
     """
-    checklist_key = filename.replace(".xlsx", "")
-    cfg = all_cfg.get(checklist_key)
-    if not cfg:
-        logging.warning(f"No checklist config for {filename}")
-        return {"cards": {}, "parallels": {}}
+    if plans is None:
+        plans = compile_checklist(cfg, defaults)
+
+    plan = plans.get(sheetname.lower())
+    if not plan:
+        logging.warning(f"No config for sheet {sheetname}, skipping")
+        return
 
-    all_results = {"cards": {}, "parallels": {}}
+    yield from iter_sheet(ws, plan, subsets)
+
+def empty_result(meta=None):
+    return {"meta": meta or {}, "subsets": {}, "cards": {}, "parallels": {}}
+
+def ingest_checklist(ws, filename, sheetname, cfg, defaults=None):
+    """
+    Process one worksheet with the per-checklist config `cfg`; `defaults`
+    is the top-level "defaults" entry that sheets without columns fall
+    back to.
+    """
+    result = empty_result(cfg.get("meta"))
+    for kind, k, record in iter_checklist(ws, filename, sheetname, cfg, defaults=defaults):
+        result[kind][k] = record
+    return result
+
+def _iter_sheets(wb, filename, cfg, plans):
+    subsets = {}
     for sheetname in wb.sheetnames:
         ws = wb[sheetname]
         logging.info(f"Processing {sheetname}...")
-        result = ingest_checklist(ws, filename, sheetname, cfg)
-        all_results["cards"].update(result["cards"])
-        all_results["parallels"].update(result["parallels"])
+        yield from iter_checklist(ws, filename, sheetname, cfg, plans, subsets)
+
+def ingest_workbook(wb, filename, all_cfg):
+    """
+    Process a workbook using the top-level checklists configuration `all_cfg`
+    (a ChecklistConfigRegistry, or a dict mapping checklist keys - filename
+    without .xlsx - to per-checklist configs).
+
+    Returns {"meta", "subsets", "cards", "parallels"}: the checklist meta
+    once, interned ChecklistSet records by id, and compact card/parallel
+    records whose `cardset` references one of those subsets.
+    """
+    cfg, plans = resolve_checklist(all_cfg, filename)
+    if cfg is None:
+        return empty_result()
+
+    return collect_result(cfg.get("meta"), _iter_sheets(wb, filename, cfg, plans))
+
+def collect_result(meta, records) -> dict:
+    all_results = empty_result(meta)
+    for kind, k, record in records:
+        all_results[kind][k] = record
     return all_results
 
-def main():
-    # Load external config if present, otherwise fall back to embedded `config`
-    if os.path.exists(CONFIG_FILE):
-        logging.info(f"Loading external checklist config from {CONFIG_FILE}")
-        cfg = load_config(CONFIG_FILE)
+# ----------------------------------------
+# Sheet-level parallelism
+# ----------------------------------------
+SHEET_CHUNK_SIZE = 1000  # records per chunk sent back by a sheet worker
+SHEET_QUEUE_DEPTH = 4  # chunks a sheet worker may run ahead of the parent
+
+def iter_workbook_parallel(path, filename, cfg, plans, workers, chunk_size=SHEET_CHUNK_SIZE):
+    """
+    Same records, in the same order, as _iter_sheets() over the workbook at
+    `path`, but every sheet is parsed in its own worker process, which
+    opens the workbook read-only and streams only that sheet.
+
+    Workers send records back in chunks of `chunk_size` through a bounded
+    queue per sheet, drained in sheet order. A worker more than
+    SHEET_QUEUE_DEPTH chunks ahead of the parent blocks, so memory stays
+    flat however large the sheets are.
+
+    Subsets are interned per sheet by the workers; a subset already seen
+    in an earlier sheet (or chunk) is dropped and its cards/parallels are
+    re-pointed at the earlier record, exactly as a sequential run shares
+    them.
+    """
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheetnames = wb.sheetnames
+    finally:
+        wb.close()
+
+    subsets = {}
+    with multiprocessing.Manager() as manager:
+        stop = manager.Event()
+        queues = [manager.Queue(maxsize=SHEET_QUEUE_DEPTH) for _ in sheetnames]
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = [
+                executor.submit(_ingest_sheet, path, filename, sheetname, cfg, plans, out, stop, chunk_size)
+                for sheetname, out in zip(sheetnames, queues)
+            ]
+            for out, future in zip(queues, futures):
+                for kind, k, record in _drain_sheet(out, future):
+                    if kind == "subsets":
+                        if k in subsets:
+                            continue
+                        subsets[k] = record
+                    elif record.cardset is not None:
+                        record.cardset = subsets[record.cardset.key]
+                    yield kind, k, record
+        finally:
+            # Unblock workers still waiting on a full queue, then reap them
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+def _drain_sheet(out, future):
+    """
+    Yield a sheet worker's records until its end marker (None).
+    """
+    while True:
+        try:
+            chunk = out.get(timeout=1.0)
+        except queue.Empty:
+            # Surface a failed or dead worker instead of waiting forever
+            if future.done():
+                future.result()
+                if out.empty():
+                    raise RuntimeError("Sheet worker exited without finishing its sheet")
+            continue
+        if chunk is None:
+            return
+        yield from chunk
+
+def _ingest_sheet(path, filename, sheetname, cfg, plans, out, stop, chunk_size=SHEET_CHUNK_SIZE):
+    """
+    Worker: stream one sheet of a read-only workbook onto `out` in chunks
+    of records, followed by None.
+    """
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                out.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    logging.info(f"Processing {sheetname}...")
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        chunk = []
+        for record in iter_checklist(wb[sheetname], filename, sheetname, cfg, plans):
+            chunk.append(record)
+            if len(chunk) >= chunk_size:
+                if not put(chunk):
+                    return
+                chunk = []
+        if chunk and not put(chunk):
+            return
+        put(None)
+    finally:
+        wb.close()
+
+def record_json(record):
+    """
+    json `default` hook: serialize checklist records lazily while dumping.
+    """
+    if isinstance(record, ChecklistRecord):
+        return record.to_dict()
+    raise TypeError(f"Object of type {type(record).__name__} is not JSON serializable")
+
+def result_json(result) -> dict:
+    """
+    JSON shape of an ingest result: meta once, subsets by id, and cards and
+    parallels pointing at their subset id through "cardset".
+    """
+    return {
+        "meta": result["meta"],
+        "subsets": {k: s.vals for k, s in result["subsets"].items()},
+        "cards": result["cards"],
+        "parallels": result["parallels"],
+    }
+
+NDJSON_RECORD_TYPES = {"subsets": "subset", "cards": "card", "parallels": "parallel"}
+
+
+def ndjson_header(filename, counts) -> str:
+    return json.dumps({"type": "header", "source_file": filename, **counts}, separators=(",", ":"))
+
+def write_workbook_ndjson(wb, filename, all_cfg, f) -> dict:
+    """
+    Stream a workbook to `f` as newline-delimited JSON in a single pass:
+
+        {"type": "header", "source_file": ..., "subsets": n, "cards": n, "parallels": n}
+        {"type": "meta", ...checklist meta}
+        {"type": "subset" | "card" | "parallel", "key": ..., ...fields}
+
+    Records are written as the sheets are read; only their keys are kept
+    in memory.
+    Cards and parallels point at their subset's key through "cardset".
+    Keys are not de-duplicated; a later record replaces an earlier one
+    with the same key. The header counts distinct keys, like the JSON
+    output, and is written first as a fixed-width placeholder and
+    rewritten in place with the final counts, so `f` must be seekable.
+    Returns the counts.
+    """
+    cfg, plans = resolve_checklist(all_cfg, filename)
+    if cfg is None:
+        return write_ndjson(filename, {}, (), f)
+    return write_ndjson(filename, cfg.get("meta", {}), _iter_sheets(wb, filename, cfg, plans), f)
+
+def write_ndjson(filename, meta, records, f) -> dict:
+    counts = {"subsets": 0, "cards": 0, "parallels": 0}
+    # Only keys are kept, so a repeated key is counted once
+    seen = {kind: set() for kind in counts}
+    # Reserve room for the largest counts the header could ever hold
+    width = len(ndjson_header(filename, dict.fromkeys(counts, 10 ** 18)))
+    start = f.tell()
+    f.write(ndjson_header(filename, counts).ljust(width) + "\n")
+    f.write(json.dumps({"type": "meta", **meta}, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+    for kind, k, record in records:
+        fields = record.vals if kind == "subsets" else record.to_dict()
+        line = {"type": NDJSON_RECORD_TYPES[kind], "key": k, **fields}
+        f.write(json.dumps(line, ensure_ascii=False, separators=(",", ":")) + "\n")
+        seen[kind].add(k)
+
+    counts = {kind: len(keys) for kind, keys in seen.items()}
+
+    end = f.tell()
+    f.seek(start)
+    f.write(ndjson_header(filename, counts).ljust(width))
+    f.seek(end)
+    return counts
+
+def process_workbook(path, cfg, fmt="json", sheet_workers=1) -> dict:
+    """
+    Ingest one workbook file and write its output next to it (.json or
+    .ndjson). With `sheet_workers > 1` its sheets are parsed concurrently
+    (see iter_workbook_parallel()); the output is identical.
+    Returns a report: file, output, cards, parallels, seconds.
+    """
+    start = time.perf_counter()
+    fname = os.path.basename(path)
+    logging.info(f"Processing workbook file {fname}")
+
+    checklist_cfg, plans = resolve_checklist(cfg, fname)
+    meta = checklist_cfg.get("meta", {}) if checklist_cfg else {}
+
+    wb = None
+    if checklist_cfg is None:
+        records = ()
+    elif sheet_workers > 1:
+        records = iter_workbook_parallel(path, fname, checklist_cfg, plans, sheet_workers)
     else:
-        logging.info("Using embedded checklist config")
-        cfg = config
+        # Read-only: rows are streamed from the file instead of loaded up front
+        wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+        records = _iter_sheets(wb, fname, checklist_cfg, plans)
 
-    if not validate_config(cfg):
+    try:
+        if fmt == "ndjson":
+            out_name = os.path.splitext(path)[0] + ".ndjson"
+            with open(out_name, "w", encoding="utf-8") as f:
+                counts = write_ndjson(fname, meta, records, f)
+        else:
+            result = collect_result(meta, records)
+            counts = {kind: len(result[kind]) for kind in ("cards", "parallels")}
+            out_name = os.path.splitext(path)[0] + ".json"
+            with open(out_name, "w", encoding="utf-8") as f:
+                json.dump(result_json(result), f, indent=2, ensure_ascii=False, default=record_json)
+    finally:
+        if wb is not None:
+            wb.close()
+
+    return {
+        "file": fname,
+        "output": out_name,
+        "cards": counts["cards"],
+        "parallels": counts["parallels"],
+        "seconds": time.perf_counter() - start,
+    }
+
+# Validated config (usually a ChecklistConfigRegistry, which keeps
+# hot-reloading inside the worker), sent to each pool worker once by _init_worker()
+_worker_cfg = None
+
+def _init_worker(cfg):
+    global _worker_cfg
+    _worker_cfg = cfg
+
+def _process_in_worker(path, fmt, sheet_workers):
+    return _process_isolated(path, _worker_cfg, fmt, sheet_workers)
+
+def _process_in_own_pool(path, cfg, fmt, sheet_workers):
+    """
+    Run one workbook in a private single-worker pool, so a worker that
+    dies takes down only this workbook's report.
+    """
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=1, initializer=_init_worker, initargs=(cfg,)) as executor:
+        try:
+            return executor.submit(_process_in_worker, path, fmt, sheet_workers).result()
+        except BrokenProcessPool as e:
+            return _failure(path, e, start)
+
+def _process_isolated(path, cfg, fmt, sheet_workers=1):
+    start = time.perf_counter()
+    try:
+        return process_workbook(path, cfg, fmt, sheet_workers)
+    except Exception as e:
+        return _failure(path, e, start)
+
+def _failure(path, error, start) -> dict:
+    return {
+        "file": os.path.basename(path),
+        "error": f"{type(error).__name__}: {error}",
+        "seconds": time.perf_counter() - start,
+    }
+
+def run_workbooks(paths, cfg, fmt="json", workers=1, sheet_workers=1):
+    """
+    Process workbook files, yielding one report per file in `paths` order.
+    With `workers > 1` files run in a process pool whose workers receive
+    `cfg` once at startup and write their own outputs. A failing workbook
+    yields a report with an "error" instead of aborting the batch.
+    `sheet_workers` is passed to process_workbook() for every file.
+
+    A worker process that dies (e.g. killed for memory on a huge file)
+    breaks the shared pool and fails every unfinished future. Those
+    workbooks are re-run, up to `workers` at a time, each in its own
+    single-worker pool, so only the workbook that actually kills its
+    worker is reported as failed.
+    """
+    if workers <= 1:
+        for path in paths:
+            yield _process_isolated(path, cfg, fmt, sheet_workers)
+        return
+
+    paths = list(paths)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(cfg,)) as executor, \
+            ThreadPoolExecutor(max_workers=workers) as retries:
+        futures = [executor.submit(_process_in_worker, path, fmt, sheet_workers) for path in paths]
+        for i, path in enumerate(paths):
+            # Workers time their own files; this only covers errors raised
+            # outside them, timed from when this file's result is awaited
+            start = time.perf_counter()
+            try:
+                yield futures[i].result()
+            except BrokenProcessPool:
+                # The pool is dead and every future is settled: retry the broken ones in isolation
+                for j in range(i, len(paths)):
+                    if isinstance(futures[j].exception(), BrokenProcessPool):
+                        futures[j] = retries.submit(_process_in_own_pool, paths[j], cfg, fmt, sheet_workers)
+                yield futures[i].result()
+            except Exception as e:
+                yield _failure(path, e, start)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ingest staged checklist workbooks into JSON.")
+    parser.add_argument(
+        "--format",
+        choices=["json", "ndjson"],
+        default="json",
+        help="json: one indented document per workbook; ndjson: stream records line by line.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Process workbooks in a pool of this many worker processes.",
+    )
+    parser.add_argument(
+        "--sheet-workers",
+        type=int,
+        default=1,
+        help="Parse the sheets of each workbook concurrently in this many worker processes.",
+    )
+    args = parser.parse_args(argv)
+
+    # Load external config if present, otherwise fall back to embedded `config`.
+    # Either way it is validated and compiled exactly once.
+    try:
+        if os.path.exists(CONFIG_FILE):
+            logging.info(f"Loading external checklist config from {CONFIG_FILE}")
+            cfg = ChecklistConfigRegistry(CONFIG_FILE)
+        else:
+            logging.info("Using embedded checklist config")
+            cfg = ChecklistConfigRegistry(config=config)
+    except RuntimeError:
         raise SystemExit("Checklist config invalid — aborting")
 
     staging_dir = os.path.join(BASE_PATH, STAGING_DIR)
@@ -495,16 +1159,23 @@ def main():
         format="%(asctime)s [%(levelname)s] %(message)s"
     )
 
-    for fname in os.listdir(staging_dir):
-        if fname.lower().endswith(".xlsx"):
-            path = os.path.join(staging_dir, fname)
-            logging.info(f"Processing workbook file {fname}")
-            wb = openpyxl.load_workbook(path)
-            result = ingest_workbook(wb, fname, cfg)
-            out_name = os.path.splitext(path)[0] + ".json"
-            with open(out_name, "w", encoding="utf-8") as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
-            print(f"Wrote {out_name} with {len(result['cards'])} cards and {len(result['parallels'])} parallels.")
+    paths = [
+        os.path.join(staging_dir, fname)
+        for fname in sorted(os.listdir(staging_dir))
+        if fname.lower().endswith(".xlsx")
+    ]
+
+    failed = 0
+    for report in run_workbooks(paths, cfg, args.format, args.workers, args.sheet_workers):
+        if "error" in report:
+            failed += 1
+            logging.error(f"Failed {report['file']}: {report['error']}")
+            print(f"Failed {report['file']} after {report['seconds']:.1f}s: {report['error']}")
+        else:
+            print(f"Wrote {report['output']} with {report['cards']} cards and "
+                  f"{report['parallels']} parallels in {report['seconds']:.1f}s.")
+
+    print(f"Processed {len(paths)} workbooks ({failed} failed).")
 
 if __name__ == '__main__':
     main()
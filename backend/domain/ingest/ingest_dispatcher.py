@@ -1,11 +1,14 @@
+from itertools import islice
 from pathlib import Path
 
 from domain.ingest.parsers.dispatcher import ChecklistParserDispatcher
-from domain.ingest.staging_writer import StagingWriter
+from domain.ingest.staging_writer import CopyStagingWriter, StagingWriter
 from domain.ingest.checklist_normalization_service import ChecklistNormalizationService
 from domain.ingest.checklist_validation_service import ChecklistValidationService
 from domain.ingest.checklist_loader import ChecklistLoader
 from domain.ingest.scanner import ScanIngestService
+from domain.ingest.pipeline import PipelinedIngest
+from domain.ingest.manifest import ChecklistManifest
 import time
 
 
@@ -19,8 +22,30 @@ class IngestDispatcher:
     CHECKLIST_EXTS = {".xlsx", ".csv", ".json"}
     SCAN_EXTS = {".jpg", ".jpeg", ".png", ".webp"}
 
-    def __init__(self, directory_path):
+    STAGING_WRITERS = {
+        "insert": StagingWriter,
+        "copy": CopyStagingWriter,
+    }
+
+    def __init__(self, directory_path, workers=1, queue_depth=None, batch_size=None,
+                 writer="insert", pipelined=False, writer_threads=1, force=False,
+                 loader_workers=1):
         self.directory = Path(directory_path)
+        # Concurrent ChecklistLoader workers (SKIP LOCKED chunk claiming)
+        self.loader_workers = loader_workers
+        # Skip checklist files recorded as unchanged in the manifest unless forced
+        self.manifest = ChecklistManifest(force=force)
+        # Run parse / normalize / write as concurrent stages (see PipelinedIngest)
+        self.pipelined = pipelined
+        self.writer_threads = writer_threads
+        # Staging rows buffered per bulk insert / COPY batch
+        self.batch_size = batch_size
+        if writer not in self.STAGING_WRITERS:
+            raise ValueError(f"Unknown staging writer: {writer}")
+        self.writer_cls = self.STAGING_WRITERS[writer]
+        # Parser process-pool settings, forwarded to ChecklistParserDispatcher
+        self.workers = workers
+        self.queue_depth = queue_depth
 
     def run(self):
         checklist_files = []
@@ -37,8 +62,11 @@ class IngestDispatcher:
             elif ext in self.SCAN_EXTS:
                 scan_files.append(file)
 
+        checklist_files = [f for f in checklist_files if self.manifest.should_parse(f)]
         if checklist_files:
             self._run_checklist_ingest()
+        else:
+            print("[ingest] No new or changed checklist files; skipping checklist ingest")
 
         if scan_files:
             self._run_scan_ingest()
@@ -48,35 +76,35 @@ class IngestDispatcher:
     # ----------------------------------------
     def _run_checklist_ingest(self):
         start = time.time()
-        count = 0
-        errors = []
-        dispatcher = ChecklistParserDispatcher(self.directory)
-        writer = StagingWriter()
-
-        for raw_row in dispatcher.parse():
-            try:
-                writer.write(raw_row)
-                # normalized = ChecklistNormalizationService(raw_row).run()
-                # ChecklistValidationService(normalized).run()
-                
-
-                count += 1
-                if count % 1000 == 0:
-                    elapsed = time.time() - start
-                    rate = count / elapsed
-                    print(f"[ingest] {count:,} rows staged "
-                          f"({elapsed:.1f}s elapsed, {rate:.1f} rows/sec)")
-
-            except Exception as e:   
-                errors.append((raw_row, str(e)))
-                print(f"[ingest][error] Failed to stage row: {e}")
-                continue
-
-        ChecklistLoader().load_validated_rows()
+        dispatcher = ChecklistParserDispatcher(
+            self.directory,
+            workers=self.workers,
+            queue_depth=self.queue_depth,
+            manifest=self.manifest,
+        )
+
+        if self.pipelined:
+            pipeline = PipelinedIngest(
+                dispatcher.parse(),
+                writer_factory=lambda: self.writer_cls(batch_size=self.batch_size),
+                writer_threads=self.writer_threads,
+                normalizer=ChecklistNormalizationService.run_staging,
+            )
+            count, errors = pipeline.run()
+            skipped = pipeline.skipped
+        else:
+            count, errors, skipped = self._stage_rows(dispatcher.parse(), start)
+
+        # Files with staging errors stay out of the manifest so they are retried
+        failed_files = {raw_row.get("_file") for raw_row, _ in errors if isinstance(raw_row, dict)}
+        self.manifest.record_all(skip_names=failed_files)
+
+        ChecklistLoader(workers=self.loader_workers).load_validated_rows()
         elapsed = time.time() - start
 
         print("\n=== INGEST SUMMARY ===")
         print(f"Rows written: {count:,}")
+        print(f"Duplicates:   {skipped:,} (already staged, skipped)")
         print(f"Errors:       {len(errors):,}")
         print(f"Total time:   {elapsed:.1f}s")
         print(f"Rate:         {count/elapsed:.1f} rows/sec")
@@ -88,6 +116,49 @@ class IngestDispatcher:
             if len(errors) > 5:
                 print("... (more errors not shown)")
 
+    def _stage_rows(self, rows, start):
+        count = 0
+        skipped = 0
+        errors = []
+
+        def record(result):
+            nonlocal count, skipped
+            if result is None:
+                return
+
+            previous = count
+            count += len(result.written)
+            skipped += result.skipped
+            for raw_row, message in result.errors:
+                errors.append((raw_row, message))
+                print(f"[ingest][error] Failed to stage row: {message}")
+
+            if count // 1000 > previous // 1000:
+                elapsed = time.time() - start
+                rate = count / elapsed
+                print(f"[ingest] {count:,} rows staged "
+                      f"({elapsed:.1f}s elapsed, {rate:.1f} rows/sec)")
+
+        rows = iter(rows)
+        with self.writer_cls(batch_size=self.batch_size) as writer:
+            while True:
+                # Normalize a writer batch at a time, column by column
+                chunk = list(islice(rows, writer.batch_size))
+                if not chunk:
+                    break
+
+                try:
+                    normalized = ChecklistNormalizationService.run_staging(chunk)
+                    record(writer.write_columns(chunk, normalized))
+                except Exception as e:
+                    # A chunk is one writer batch, so none of its rows were staged
+                    errors.extend((raw_row, str(e)) for raw_row in chunk)
+                    print(f"[ingest][error] Failed to stage {len(chunk):,} rows: {e}")
+
+            record(writer.close())
+
+        return count, errors, skipped
+
     # ----------------------------------------
     # Scan ingest pipeline
     # ----------------------------------------
@@ -14,6 +14,52 @@ class Command(BaseCommand):
             action="store_true",
             help="Run ingest without writing to the database; output rows to a file."
         )
+        parser.add_argument(
+            "--loader-workers",
+            type=int,
+            default=1,
+            help="Number of concurrent loader workers claiming staging chunks (PostgreSQL only)."
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Re-parse every checklist file, even those unchanged since the last ingest."
+        )
+        parser.add_argument(
+            "--pipeline",
+            action="store_true",
+            help="Overlap parsing and staging writes using bounded queues and background writer threads."
+        )
+        parser.add_argument(
+            "--writer-threads",
+            type=int,
+            default=1,
+            help="Number of staging writer threads in --pipeline mode."
+        )
+        parser.add_argument(
+            "--writer",
+            choices=sorted(IngestDispatcher.STAGING_WRITERS),
+            default="insert",
+            help="Staging write strategy: batched INSERTs or PostgreSQL COPY (falls back to INSERTs on other backends)."
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="Number of staging rows inserted per bulk_create batch."
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of parser processes; files and workbook sheets are parsed in parallel when > 1."
+        )
+        parser.add_argument(
+            "--queue-depth",
+            type=int,
+            default=None,
+            help="Maximum number of parsed row batches buffered between parser processes and the writer."
+        )
 
     def run_staging_phase(self) -> int:
         # In this simplified example, we assume staging is done in the dispatcher
@@ -48,7 +94,17 @@ class Command(BaseCommand):
         deleted = self.cleanup_processed_rows()
         self.stdout.write(self.style.WARNING(f"Cleaned up {deleted:,} processed staging rows"))
 
-        dispatcher = IngestDispatcher(directory)
+        dispatcher = IngestDispatcher(
+            directory,
+            workers=options["workers"],
+            queue_depth=options["queue_depth"],
+            batch_size=options["batch_size"],
+            writer=options["writer"],
+            pipelined=options["pipeline"],
+            writer_threads=options["writer_threads"],
+            force=options["force"],
+            loader_workers=options["loader_workers"],
+        )
         dispatcher.run()
 
         self.stdout.write(self.style.SUCCESS("Ingest completed successfully."))
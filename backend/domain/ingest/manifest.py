@@ -0,0 +1,79 @@
+from pathlib import Path
+
+from domain.hashing import hash_file
+from mintcastiq.models.checklist_file_manifest import ChecklistFileManifest
+
+
+class ChecklistManifest:
+    """
+    Decides which checklist files need to be parsed, based on the
+    ChecklistFileManifest table.
+
+    A file is unchanged when its (size, mtime) match the recorded entry, or
+    when they differ but its `hash_file` digest still matches. Digests are
+    therefore only computed for new or touched files. With `force=True`
+    every file is parsed, but the manifest is still refreshed afterwards.
+    """
+
+    def __init__(self, force=False):
+        self.force = force
+        self._entries = None
+        self._observed = {}  # path -> (size, mtime_ns, digest) for files to record
+
+    def _load(self):
+        if self._entries is None:
+            self._entries = {e.path: e for e in ChecklistFileManifest.objects.all()}
+        return self._entries
+
+    @staticmethod
+    def _key(file_path):
+        return str(Path(file_path).resolve())
+
+    def should_parse(self, file_path) -> bool:
+        key = self._key(file_path)
+        if key in self._observed:
+            return True
+
+        stat = Path(file_path).stat()
+        entry = self._load().get(key)
+
+        if entry and entry.size == stat.st_size and entry.mtime_ns == stat.st_mtime_ns:
+            if not self.force:
+                return False
+            digest = entry.digest
+        else:
+            digest = hash_file(key)
+            if entry and entry.digest == digest and not self.force:
+                # Touched but identical: remember the new stat so we skip hashing next time
+                entry.size = stat.st_size
+                entry.mtime_ns = stat.st_mtime_ns
+                entry.save(update_fields=["size", "mtime_ns"])
+                return False
+
+        self._observed[key] = (stat.st_size, stat.st_mtime_ns, digest)
+        return True
+
+    def record(self, file_path):
+        """
+        Mark a file as fully ingested. Call only after its rows are staged.
+        """
+        key = self._key(file_path)
+        observed = self._observed.pop(key, None)
+        if observed is None:
+            return
+
+        size, mtime_ns, digest = observed
+        entry, _ = ChecklistFileManifest.objects.update_or_create(
+            path=key,
+            defaults={"size": size, "mtime_ns": mtime_ns, "digest": digest},
+        )
+        self._load()[key] = entry
+
+    def record_all(self, skip_names=()):
+        """
+        Record every parsed file except those named in `skip_names`
+        (files that produced staging errors and should be retried).
+        """
+        for key in list(self._observed):
+            if Path(key).name not in skip_names:
+                self.record(key)
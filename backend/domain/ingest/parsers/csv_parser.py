@@ -6,7 +6,8 @@ class CSVChecklistParser:
     """
     Parses a contributor-provided CSV checklist file and yields raw dict rows.
     This parser performs no normalization or validation — it simply exposes
-    the contributor's input in a structured form.
+    the contributor's input in a structured form. Each row carries its
+    1-based record number (`_row`, the header being row 1) for provenance.
     """
 
     def __init__(self, file_path):
@@ -19,7 +20,8 @@ class CSVChecklistParser:
         with self.file_path.open("r", encoding="utf-8-sig", newline="") as f:
             reader = csv.DictReader(f)
 
-            for row in reader:
+            for row_number, row in enumerate(reader, start=2):
                 # Convert empty strings to None for consistency
                 cleaned = {k: (v.strip() if isinstance(v, str) else v) or None for k, v in row.items()}
+                cleaned["_row"] = row_number
                 yield cleaned
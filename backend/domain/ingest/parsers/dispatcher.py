@@ -1,3 +1,6 @@
+import multiprocessing
+import queue
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from domain.ingest.parsers.csv_parser import CSVChecklistParser
@@ -9,6 +12,18 @@ class ChecklistParserDispatcher:
     """
     Walks a directory and dispatches each file to the correct parser
     based on file extension. Yields raw rows with file-level provenance.
+
+    With `workers > 1` files (and individual sheets of .xlsx workbooks) are
+    parsed in a process pool. Workers push row batches through a bounded
+    queue of `queue_depth` batches; rows of each file are still yielded in
+    file order, although rows of different files may interleave. Batches
+    of a sheet that cannot be yielded yet (an earlier sheet of the same
+    workbook is still parsing) are buffered, but each unit may be at most
+    `unit_depth` batches ahead of the consumer before its worker blocks.
+
+    Workers and the queue manager are started with `START_METHOD` rather
+    than the platform default: forking a parent that may already hold
+    threads and open DB connections is unsafe.
     """
 
     SUPPORTED_EXTENSIONS = {
@@ -17,27 +32,182 @@ class ChecklistParserDispatcher:
         ".json": JSONChecklistParser,
     }
 
-    def __init__(self, directory_path):
+    BATCH_SIZE = 500
+    DEFAULT_QUEUE_DEPTH = 64
+    DEFAULT_UNIT_DEPTH = 8
+    START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+    def __init__(self, directory_path, workers=1, queue_depth=None, manifest=None, unit_depth=None):
         self.directory = Path(directory_path)
+        # Optional ChecklistManifest; unchanged files are skipped before parsing
+        self.manifest = manifest
+        self.workers = workers or 1
+        self.queue_depth = queue_depth or self.DEFAULT_QUEUE_DEPTH
+        self.unit_depth = unit_depth or self.DEFAULT_UNIT_DEPTH
 
     def parse(self):
         if not self.directory.exists():
             raise FileNotFoundError(f"Directory not found: {self.directory}")
 
-        for file_path in self.directory.iterdir():
+        if self.workers > 1:
+            yield from self._parse_parallel()
+            return
+
+        for file_path in self._checklist_files():
+            parser = self.SUPPORTED_EXTENSIONS[file_path.suffix.lower()](file_path)
+
+            for row in parser.parse():
+                # Add provenance for audit clarity
+                row["_file"] = file_path.name
+                yield row
+
+    def _checklist_files(self):
+        for file_path in sorted(self.directory.iterdir()):
             if not file_path.is_file():
                 continue
 
-            ext = file_path.suffix.lower()
-            parser_cls = self.SUPPORTED_EXTENSIONS.get(ext)
+            # Skip unsupported files silently
+            if file_path.suffix.lower() not in self.SUPPORTED_EXTENSIONS:
+                continue
 
-            if not parser_cls:
-                # Skip unsupported files silently or log it
+            if self.manifest is not None and not self.manifest.should_parse(file_path):
                 continue
 
-            parser = parser_cls(file_path)
+            yield file_path
 
-            for row in parser.parse():
-                # Add provenance for audit clarity
-                row["_file"] = file_path.name
-                yield row
+    # ----------------------------------------
+    # Parallel parsing
+    # ----------------------------------------
+    def _work_units(self):
+        """
+        Split the directory into (file_path, sheet_name) units. Workbooks are
+        split per sheet; every other file is a single unit.
+        """
+        units = []
+        for file_path in self._checklist_files():
+            if file_path.suffix.lower() == ".xlsx":
+                for sheet_name in ExcelChecklistParser(file_path).list_sheets():
+                    units.append((file_path, sheet_name))
+            else:
+                units.append((file_path, None))
+        return units
+
+    def _parse_parallel(self):
+        units = self._work_units()
+        if not units:
+            return
+
+        # Units belonging to the same file, in the order they must be yielded
+        file_units = {}
+        for idx, (file_path, _) in enumerate(units):
+            file_units.setdefault(file_path, []).append(idx)
+
+        pending = {idx: [] for idx in range(len(units))}  # buffered batches
+        finished = set()
+        cursor = {file_path: 0 for file_path in file_units}
+
+        mp_context = multiprocessing.get_context(self.START_METHOD)
+        with mp_context.Manager() as manager:
+            rows_queue = manager.Queue(maxsize=self.queue_depth)
+            stop = manager.Event()
+            # Per-unit credits: a worker takes one per batch, the parent
+            # returns it once the batch is yielded, so buffering stays bounded
+            credits = [manager.Semaphore(self.unit_depth) for _ in units]
+            executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=mp_context)
+
+            try:
+                futures = [
+                    executor.submit(
+                        _parse_unit, idx, str(file_path), sheet_name,
+                        rows_queue, credits[idx], stop, self.BATCH_SIZE,
+                    )
+                    for idx, (file_path, sheet_name) in enumerate(units)
+                ]
+
+                remaining = len(units)
+                while remaining:
+                    try:
+                        kind, idx, payload = rows_queue.get(timeout=1.0)
+                    except queue.Empty:
+                        # Surface crashed workers instead of waiting forever
+                        for future in futures:
+                            if future.done() and future.exception():
+                                raise future.exception()
+                        continue
+
+                    if kind == "error":
+                        file_path, sheet_name = units[idx]
+                        where = f"{file_path.name}:{sheet_name}" if sheet_name else file_path.name
+                        raise RuntimeError(f"Failed to parse {where}: {payload}")
+
+                    if kind == "done":
+                        finished.add(idx)
+                        remaining -= 1
+                    else:
+                        pending[idx].append(payload)
+
+                    # Release everything that is now in order for this file
+                    file_path = units[idx][0]
+                    order = file_units[file_path]
+                    while cursor[file_path] < len(order):
+                        head = order[cursor[file_path]]
+                        while pending[head]:
+                            batch = pending[head].pop(0)
+                            credits[head].release()
+                            for row in batch:
+                                row["_file"] = file_path.name
+                                yield row
+                        if head not in finished:
+                            break
+                        cursor[file_path] += 1
+            finally:
+                stop.set()
+                executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _parse_unit(idx, file_path, sheet_name, rows_queue, credits, stop, batch_size):
+    """
+    Process-pool worker: parse one file (or one workbook sheet) and push
+    row batches onto the shared queue, followed by a "done" marker. Each
+    batch first takes one of the unit's credits.
+    """
+
+    def acquire():
+        while not stop.is_set():
+            if credits.acquire(timeout=0.5):
+                return True
+        return False
+
+    def put(item):
+        if item[0] == "rows" and not acquire():
+            return False
+        while not stop.is_set():
+            try:
+                rows_queue.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    path = Path(file_path)
+    try:
+        parser_cls = ChecklistParserDispatcher.SUPPORTED_EXTENSIONS[path.suffix.lower()]
+        if sheet_name is not None:
+            parser = parser_cls(path, sheet_names=[sheet_name])
+        else:
+            parser = parser_cls(path)
+
+        batch = []
+        for row in parser.parse():
+            batch.append(row)
+            if len(batch) >= batch_size:
+                if not put(("rows", idx, batch)):
+                    return
+                batch = []
+        if batch and not put(("rows", idx, batch)):
+            return
+    except Exception as e:
+        put(("error", idx, str(e)))
+        return
+
+    put(("done", idx, None))
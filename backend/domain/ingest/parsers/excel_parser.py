@@ -6,35 +6,57 @@ class ExcelChecklistParser:
     """
     Parses a contributor-provided Excel (.xlsx) checklist file containing
     multiple sheets. Yields raw dict rows with sheet context included.
+
+    The workbook is opened in read-only mode and every sheet is streamed
+    lazily, so memory stays flat regardless of workbook size. Each row
+    carries its sheet name (`_sheet`) and 1-based worksheet row number
+    (`_row`) for provenance.
     """
 
-    def __init__(self, file_path):
+    def __init__(self, file_path, sheet_names=None):
         self.file_path = Path(file_path)
+        # Optional subset of sheets to stream (used for per-sheet parallelism)
+        self.sheet_names = sheet_names
 
-    def parse(self):
+    def list_sheets(self):
         if not self.file_path.exists():
             raise FileNotFoundError(f"Checklist file not found: {self.file_path}")
 
-        workbook = openpyxl.load_workbook(self.file_path, data_only=True)
-
-        # Always take the last sheet
-        sheet = workbook.worksheets[-1]
-
-        # Skip sheets with no data rows
-        if sheet.max_row < 2:
-            return []
-
-        # Extract headers from row 1
-        headers = [cell.value for cell in sheet[1]]
+        workbook = openpyxl.load_workbook(self.file_path, read_only=True)
+        try:
+            return list(workbook.sheetnames)
+        finally:
+            workbook.close()
 
-        # Skip sheets with no headers
-        if not any(headers):
-            return []
-
-        raw_rows = []
-
-        for row in sheet.iter_rows(min_row=2, values_only=True):
-            raw_rows.append(dict(zip(headers, row)))
+    def parse(self):
+        if not self.file_path.exists():
+            raise FileNotFoundError(f"Checklist file not found: {self.file_path}")
 
-        return raw_rows
-            
+        workbook = openpyxl.load_workbook(self.file_path, read_only=True, data_only=True)
+
+        try:
+            for sheet in workbook.worksheets:
+                if self.sheet_names is not None and sheet.title not in self.sheet_names:
+                    continue
+                yield from self._parse_sheet(sheet)
+        finally:
+            # Read-only workbooks keep the underlying archive open until closed
+            workbook.close()
+
+    def _parse_sheet(self, sheet):
+        rows = sheet.iter_rows(values_only=True)
+
+        # Extract headers from row 1; empty sheets yield nothing
+        headers = next(rows, None)
+        if not headers or not any(headers):
+            return
+
+        for row_number, row in enumerate(rows, start=2):
+            # Read-only sheets often report trailing blank rows
+            if not any(value is not None for value in row):
+                continue
+
+            raw_row = dict(zip(headers, row))
+            raw_row["_sheet"] = sheet.title
+            raw_row["_row"] = row_number
+            yield raw_row
@@ -3,12 +3,188 @@ from pathlib import Path
 
 
 class JSONChecklistParser:
-    def __init__(self, file_path):
+    """
+    Parses a contributor-provided JSON checklist file and yields raw dict rows.
+
+    Two document shapes are supported:
+    - a top-level array of rows: `[{...}, {...}]`
+    - an object of named row arrays, e.g. `{"checklist": [...], "parallels": [...]}`;
+      each row is tagged with the array it came from (`_section`)
+
+    Object rows carry their 1-based position in their array (`_row`) for
+    provenance, so identical rows are not mistaken for duplicates.
+
+    Array elements are decoded one at a time from a fixed-size read buffer,
+    so the file is never loaded fully into memory and the first row is
+    available as soon as it has been read.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, file_path, chunk_size=None):
         self.file_path = Path(file_path)
+        self.chunk_size = chunk_size or self.CHUNK_SIZE
 
     def parse(self):
-        with self.file_path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        if not self.file_path.exists():
+            raise FileNotFoundError(f"Checklist file not found: {self.file_path}")
+
+        with self.file_path.open("r", encoding="utf-8-sig") as f:
+            stream = _JSONStream(f, self.chunk_size)
+            first = stream.peek()
+
+            if first == "[":
+                for row_number, row in enumerate(stream.iter_array(), start=1):
+                    if isinstance(row, dict):
+                        row["_row"] = row_number
+                    yield row
+            elif first == "{":
+                for section, is_array in stream.iter_object_keys():
+                    if not is_array:
+                        stream.decode_value()  # scalar/metadata member, ignore
+                        continue
+                    for row_number, row in enumerate(stream.iter_array(), start=1):
+                        if isinstance(row, dict):
+                            row["_section"] = section
+                            row["_row"] = row_number
+                        yield row
+            else:
+                raise ValueError(
+                    f"Unsupported JSON checklist layout in {self.file_path.name}: "
+                    f"expected an array or object, found {first!r}"
+                )
+
+
+class _JSONStream:
+    """
+    Minimal pull tokenizer over a text file. Only the container structure
+    (the outer array/object) is walked by hand; each element is decoded with
+    `json.JSONDecoder.raw_decode`, refilling the buffer when it is cut short.
+
+    A decode error is only treated as truncation when it sits at the end of
+    the buffer (or is an unterminated string) and the file has more to
+    read; reads then grow geometrically. A single element larger than
+    MAX_ELEMENT_CHARS is rejected. Errors report the absolute character
+    offset in the file.
+    """
+
+    WHITESPACE = " \t\n\r"
+    MAX_ELEMENT_CHARS = 16 * 1024 * 1024
+    # Longest token a decode error can point at when merely cut short
+    # ("-Infinity", a \uXXXX\uXXXX surrogate pair)
+    TRUNCATION_TAIL = 16
+
+    def __init__(self, f, chunk_size):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buf = ""
+        self.pos = 0
+        self.offset = 0  # file offset (in characters) of buf[0]
+        self.eof = False
+
+    # ----------------------------------------
+    # Buffer management
+    # ----------------------------------------
+    def _fill(self, size=None):
+        if self.eof:
+            return False
+        chunk = self.f.read(size or self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        # Drop consumed text so the buffer never grows past one element + chunk
+        self.offset += self.pos
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def _grow(self):
+        """
+        Read more of the element being decoded: at least as much again as is
+        already buffered, so retries cost O(element size) overall.
+        """
+        pending = len(self.buf) - self.pos
+        if pending >= self.MAX_ELEMENT_CHARS:
+            raise ValueError(
+                f"JSON element at offset {self.offset + self.pos} exceeds "
+                f"{self.MAX_ELEMENT_CHARS:,} characters"
+            )
+        return self._fill(max(self.chunk_size, pending))
+
+    def _truncated(self, error):
+        return not self.eof and (
+            error.pos >= len(self.buf) - self.TRUNCATION_TAIL
+            or error.msg.startswith("Unterminated string")
+        )
+
+    def peek(self):
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in self.WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON document")
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Malformed JSON: expected {char!r}, found {found!r}")
+        self.pos += 1
+
+    def decode_value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as e:
+                if self._truncated(e) and self._grow():
+                    continue
+                raise ValueError(f"Malformed JSON at offset {self.offset + e.pos}: {e.msg}") from e
+
+            # A number or literal ending exactly at the buffer edge may be truncated
+            if end == len(self.buf) and self._grow():
+                continue
+
+            self.pos = end
+            return value
+
+    # ----------------------------------------
+    # Containers
+    # ----------------------------------------
+    def iter_array(self):
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+
+        while True:
+            yield self.decode_value()
+            sep = self.peek()
+            self.pos += 1
+            if sep == "]":
+                return
+            if sep != ",":
+                raise ValueError(f"Malformed JSON array: unexpected {sep!r}")
+
+    def iter_object_keys(self):
+        """
+        Walk the members of an object, yielding `(key, value_is_array)`.
+        The caller must consume the value before advancing the iterator.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
 
-        for row in data:
-            yield row
+        while True:
+            key = self.decode_value()
+            self.expect(":")
+            yield key, self.peek() == "["
+            sep = self.peek()
+            self.pos += 1
+            if sep == "}":
+                return
+            if sep != ",":
+                raise ValueError(f"Malformed JSON object: unexpected {sep!r}")
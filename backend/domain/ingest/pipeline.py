@@ -0,0 +1,249 @@
+import queue
+import threading
+import time
+
+from django.db import connection
+
+
+_DONE = object()
+
+
+class StageStats:
+    """
+    Row counter + wall-clock window for a single pipeline stage.
+    """
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+        self.start = None
+        self.end = None
+        self._lock = threading.Lock()
+
+    def begin(self):
+        with self._lock:
+            if self.start is None:
+                self.start = time.time()
+
+    def add(self, n):
+        with self._lock:
+            self.count += n
+
+    def finish(self):
+        with self._lock:
+            self.end = time.time()
+
+    @property
+    def elapsed(self):
+        if self.start is None:
+            return 0.0
+        return (self.end or time.time()) - self.start
+
+    @property
+    def rate(self):
+        return self.count / self.elapsed if self.elapsed else 0.0
+
+    def report(self):
+        print(f"[pipeline][{self.name}] {self.count:,} rows "
+              f"({self.elapsed:.1f}s, {self.rate:.1f} rows/sec)")
+
+
+class PipelinedIngest:
+    """
+    Runs checklist staging as three concurrent stages joined by bounded
+    queues:
+
+        parse ──► normalize ──► write (x writer_threads)
+
+    Rows travel between stages in chunks of `chunk_size`; each queue holds
+    at most `queue_size` chunks, so a slow stage blocks its upstream stage
+    instead of letting memory grow. Writer threads each own a staging
+    writer (and therefore their own DB connection), overlapping database
+    round trips with parsing.
+
+    `normalizer`, when given, is called once per chunk in the normalize
+    stage and returns the chunk's normalized values as column arrays (e.g.
+    ChecklistNormalizationService.run_staging); the chunk is then written
+    with `writer.write_columns(rows, normalized)`.
+    """
+
+    DEFAULT_CHUNK_SIZE = 500
+    DEFAULT_QUEUE_SIZE = 8
+
+    def __init__(self, rows, writer_factory, writer_threads=1,
+                 chunk_size=None, queue_size=None, normalizer=None):
+        self.rows = rows
+        self.writer_factory = writer_factory
+        self.normalizer = normalizer
+        self.writer_threads = max(1, writer_threads or 1)
+        self.chunk_size = chunk_size or self.DEFAULT_CHUNK_SIZE
+        queue_size = queue_size or self.DEFAULT_QUEUE_SIZE
+
+        self.parsed = queue.Queue(maxsize=queue_size)
+        self.normalized = queue.Queue(maxsize=queue_size)
+
+        self.stats = {
+            "parse": StageStats("parse"),
+            "normalize": StageStats("normalize"),
+            "write": StageStats("write"),
+        }
+        self.errors = []
+        self.skipped = 0  # rows dropped as already staged
+        self._errors_lock = threading.Lock()
+        self._abort = threading.Event()
+        self._failures = []
+
+    def run(self):
+        """
+        Execute the pipeline and block until every stage has drained.
+        Returns (rows_written, errors). Re-raises the first stage failure.
+        """
+        threads = [
+            threading.Thread(target=self._guard, args=(self._parse_stage,), name="ingest-parse"),
+            threading.Thread(target=self._guard, args=(self._normalize_stage,), name="ingest-normalize"),
+        ]
+        threads += [
+            threading.Thread(target=self._guard, args=(self._write_stage, True), name=f"ingest-write-{i}")
+            for i in range(self.writer_threads)
+        ]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for stats in self.stats.values():
+            stats.report()
+
+        if self._failures:
+            raise self._failures[0]
+
+        return self.stats["write"].count, self.errors
+
+    # ----------------------------------------
+    # Stages
+    # ----------------------------------------
+    def _parse_stage(self):
+        stats = self.stats["parse"]
+        stats.begin()
+        chunk = []
+        try:
+            for raw_row in self.rows:
+                chunk.append(raw_row)
+                if len(chunk) >= self.chunk_size:
+                    stats.add(len(chunk))
+                    if not self._put(self.parsed, chunk):
+                        return
+                    chunk = []
+            if chunk:
+                stats.add(len(chunk))
+                self._put(self.parsed, chunk)
+        finally:
+            stats.finish()
+            self._put(self.parsed, _DONE)
+
+    def _normalize_stage(self):
+        stats = self.stats["normalize"]
+        stats.begin()
+        try:
+            while True:
+                chunk = self._get(self.parsed)
+                if chunk is _DONE:
+                    return
+
+                normalized = self.normalizer(chunk) if self.normalizer is not None else None
+
+                stats.add(len(chunk))
+                if chunk and not self._put(self.normalized, (chunk, normalized)):
+                    return
+        finally:
+            stats.finish()
+            for _ in range(self.writer_threads):
+                self._put(self.normalized, _DONE)
+
+    def _write_stage(self):
+        stats = self.stats["write"]
+        stats.begin()
+        try:
+            writer = self.writer_factory()
+            try:
+                while True:
+                    item = self._get(self.normalized)
+                    if item is _DONE:
+                        break
+
+                    chunk, normalized = item
+                    if normalized is not None:
+                        try:
+                            self._record_result(writer.write_columns(chunk, normalized))
+                        except Exception as e:
+                            for raw_row in chunk:
+                                self._record_error(raw_row, str(e))
+                        continue
+
+                    for raw_row in chunk:
+                        try:
+                            self._record_result(writer.write(raw_row))
+                        except Exception as e:
+                            self._record_error(raw_row, str(e))
+            finally:
+                # Flush the last partial batch, also when the pipeline aborts
+                self._record_result(writer.close())
+        finally:
+            stats.finish()
+
+    # ----------------------------------------
+    # Helpers
+    # ----------------------------------------
+    def _guard(self, stage, uses_db=False):
+        try:
+            stage()
+        except BaseException as e:
+            self._failures.append(e)
+            self._abort.set()
+        finally:
+            if uses_db:
+                # Each writer thread gets its own connection; release it
+                connection.close()
+
+    def _put(self, q, item):
+        # Sentinels must always get through so downstream stages can exit
+        while True:
+            try:
+                q.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                if self._abort.is_set() and item is not _DONE:
+                    return False
+                if self._abort.is_set():
+                    self._drain(q)
+
+    def _get(self, q):
+        while True:
+            try:
+                return q.get(timeout=0.5)
+            except queue.Empty:
+                # A failed stage may never send its sentinel
+                if self._abort.is_set():
+                    return _DONE
+
+    @staticmethod
+    def _drain(q):
+        try:
+            while True:
+                q.get_nowait()
+        except queue.Empty:
+            pass
+
+    def _record_result(self, result):
+        if result is None:
+            return
+        self.stats["write"].add(len(result.written))
+        with self._errors_lock:
+            self.skipped += getattr(result, "skipped", 0)
+        for raw_row, message in result.errors:
+            self._record_error(raw_row, message)
+
+    def _record_error(self, raw_row, message):
+        with self._errors_lock:
+            self.errors.append((raw_row, message))
+        print(f"[ingest][error] Failed to stage row: {message}")
@@ -1,19 +1,65 @@
 import datetime
 import json
+import logging
 import time
 import os.path
 from decimal import Decimal
+from django.db import DataError, connection, transaction
+from django.utils import timezone
+from domain.hashing import hash_string
 from mintcastiq.models.staging.staging_checklist_row import StagingChecklistRow
 
+logger = logging.getLogger(__name__)
+
+
+class StagingBatchResult:
+    """
+    Outcome of a single staging flush: rows that were inserted,
+    (raw_row, message) pairs for rows that could not be staged, and the
+    number of rows skipped because an identical row was already staged.
+    """
+    def __init__(self, written=None, errors=None, skipped=0):
+        self.written = written or []
+        self.errors = errors or []
+        self.skipped = skipped
 
 
 class StagingWriter:
     """
     Writes normalized checklist rows into the staging table.
+
+    Rows are buffered and inserted with `bulk_create` once `batch_size`
+    rows have accumulated. `write()` returns a StagingBatchResult whenever
+    a batch was flushed (None otherwise); call `close()` (or use the writer
+    as a context manager) to flush the remainder. If a batch insert fails,
+    the batch is retried row by row so errors stay attributable to the
+    offending raw row.
+
+    Every row carries a `content_hash` of its canonicalized raw_row (which
+    includes the _file/_sheet/_row provenance). Rows whose hash is already
+    staged are skipped (ON CONFLICT DO NOTHING), making re-ingest idempotent.
+    Inserted rows are returned without primary keys.
+
+    `write()` optionally takes the row's normalized values ({field: value}),
+    which fill the staging row's `normalized_<field>` columns.
+    `write_columns()` stages a whole chunk whose normalized values come as
+    column arrays (ChecklistNormalizationService.run_staging), without a
+    dict per row.
     """
-    def __init__(self):
+    DEFAULT_BATCH_SIZE = 1000
+
+    def __init__(self, batch_size=None):
+        self.batch_size = batch_size or self.DEFAULT_BATCH_SIZE
         self.count = 0
         self.start_time = time.time()
+        self._buffer = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
 
     @staticmethod
     def json_safe(value):
@@ -23,18 +69,204 @@ class StagingWriter:
             return float(value)
         return value
 
-    def write(self, raw_row: dict) -> StagingChecklistRow:
+    @staticmethod
+    def content_hash(safe_row: dict) -> str:
+        # Parsers can yield non-string keys (None for a blank Excel header
+        # cell or csv.DictReader's extra fields), which sort_keys can't order
+        canonical = json.dumps(
+            {str(k): v for k, v in safe_row.items()},
+            sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str,
+        )
+        return hash_string(canonical)
+
+    def _staging_row(self, raw_row: dict) -> StagingChecklistRow:
         safe_row = {k: self.json_safe(v) for k, v in raw_row.items()}
-        staging = StagingChecklistRow.objects.create(raw_row=safe_row)
-        self.count += 1
+        return StagingChecklistRow(raw_row=safe_row, content_hash=self.content_hash(safe_row))
 
-        if self.count % 1000 == 0:
+    def write(self, raw_row: dict, normalized: dict = None):
+        staging = self._staging_row(raw_row)
+        if normalized:
+            for field, value in normalized.items():
+                setattr(staging, f"normalized_{field}", value)
+        self._buffer.append((raw_row, staging))
+
+        if len(self._buffer) >= self.batch_size:
+            return self.flush()
+        return None
+
+    def write_columns(self, raw_rows, normalized: dict) -> StagingBatchResult:
+        """
+        Write a chunk of raw rows whose normalized values are given as
+        column arrays ({field: values}, aligned with `raw_rows`). Returns
+        the combined StagingBatchResult of the batches flushed meanwhile;
+        rows that cannot be staged at all are reported in its errors.
+        """
+        result = StagingBatchResult()
+        columns = [(f"normalized_{field}", values) for field, values in normalized.items()]
+
+        for i, raw_row in enumerate(raw_rows):
+            try:
+                staging = self._staging_row(raw_row)
+            except Exception as e:
+                result.errors.append((raw_row, str(e)))
+                continue
+            for attname, values in columns:
+                setattr(staging, attname, values[i])
+            self._buffer.append((raw_row, staging))
+
+            if len(self._buffer) >= self.batch_size:
+                flushed = self.flush()
+                result.written.extend(flushed.written)
+                result.errors.extend(flushed.errors)
+                result.skipped += flushed.skipped
+
+        return result
+
+    def flush(self) -> StagingBatchResult:
+        if not self._buffer:
+            return StagingBatchResult()
+
+        batch, self._buffer = self._buffer, []
+
+        # Identical rows within one batch collapse onto the first occurrence
+        unique = {}
+        for raw_row, staging in batch:
+            unique.setdefault(staging.content_hash, (raw_row, staging))
+
+        result = self._insert(list(unique.values()))
+        result.skipped += len(batch) - len(unique)
+        return result
+
+    def close(self) -> StagingBatchResult:
+        return self.flush()
+
+    def _insert(self, batch) -> StagingBatchResult:
+        hashes = [staging.content_hash for _, staging in batch]
+        already_staged = set(
+            StagingChecklistRow.objects
+            .filter(content_hash__in=hashes)
+            .values_list("content_hash", flat=True)
+        )
+        fresh = [(raw_row, staging) for raw_row, staging in batch
+                 if staging.content_hash not in already_staged]
+        result = StagingBatchResult(skipped=len(batch) - len(fresh))
+
+        try:
+            with transaction.atomic():
+                StagingChecklistRow.objects.bulk_create(
+                    [staging for _, staging in fresh],
+                    ignore_conflicts=True,
+                )
+            result.written = [staging for _, staging in fresh]
+        except Exception:
+            # Retry one row at a time to pinpoint the failing rows
+            for raw_row, staging in fresh:
+                try:
+                    with transaction.atomic():
+                        staging.pk = None
+                        staging.save(force_insert=True)
+                    result.written.append(staging)
+                except Exception as e:
+                    result.errors.append((raw_row, str(e)))
+
+        self._report(len(result.written))
+        return result
+
+    def _report(self, written):
+        previous = self.count
+        self.count += written
+
+        if self.count // 1000 > previous // 1000:
             elapsed = time.time() - self.start_time
-            rate = self.count / elapsed
+            rate = self.count / elapsed if elapsed else 0.0
             print(f"[staging] {self.count:,} rows written "
                   f"({elapsed:.1f}s elapsed, {rate:.1f} rows/sec)")
 
-        return staging
+
+class CopyStagingWriter(StagingWriter):
+    """
+    StagingWriter variant that streams each batch into Postgres with
+    `COPY ... FROM STDIN` instead of a multi-row INSERT.
+
+    Rows are written to the COPY stream one at a time, so only the current
+    batch is ever held in memory. COPY cannot skip conflicts itself, so each
+    batch lands in a transaction-scoped temp table and is moved into the
+    staging table with `INSERT ... ON CONFLICT (content_hash) DO NOTHING`.
+    The temp table is dropped first if it exists, since ON COMMIT DROP
+    does not fire between batches written inside an outer transaction.
+
+    Non-Postgres backends use StagingWriter's bulk_create path. Drivers
+    without psycopg 3 COPY support and batches Postgres rejects as bad
+    data (DataError) fall back to it too, with a warning; the latter are
+    retried row by row for error attribution. Any other database error
+    propagates.
+    """
+    COPY_COLUMNS = (
+        "raw_row", "content_hash", "status", "created_at", "updated_at",
+        "normalized_set", "normalized_card_number", "normalized_player", "normalized_parallel",
+    )
+    TEMP_TABLE = "staging_checklist_copy"
+
+    def __init__(self, batch_size=None):
+        super().__init__(batch_size)
+        self._copy_supported = True
+
+    def _insert(self, batch) -> StagingBatchResult:
+        if connection.vendor != "postgresql" or not self._copy_supported:
+            return super()._insert(batch)
+
+        with connection.cursor() as cursor:
+            if not hasattr(cursor.cursor, "copy"):
+                logger.warning("Database driver has no COPY support (psycopg 3 required); "
+                               "staging with bulk_create instead")
+                self._copy_supported = False
+                return super()._insert(batch)
+
+        now = timezone.now()
+        qn = connection.ops.quote_name
+        table = qn(StagingChecklistRow._meta.db_table)
+        temp = qn(self.TEMP_TABLE)
+        columns = ", ".join(qn(c) for c in self.COPY_COLUMNS)
+
+        try:
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(f"DROP TABLE IF EXISTS {temp}")
+                cursor.execute(
+                    f"CREATE TEMP TABLE {temp} ON COMMIT DROP AS "
+                    f"SELECT {columns} FROM {table} WITH NO DATA"
+                )
+                # The raw psycopg cursor bypasses Django's error translation
+                with connection.wrap_database_errors, \
+                        cursor.cursor.copy(f"COPY {temp} ({columns}) FROM STDIN") as copy:
+                    for _, staging in batch:
+                        copy.write_row((
+                            json.dumps(staging.raw_row, ensure_ascii=False),
+                            staging.content_hash,
+                            staging.status,
+                            now,
+                            now,
+                            staging.normalized_set,
+                            staging.normalized_card_number,
+                            staging.normalized_player,
+                            staging.normalized_parallel,
+                        ))
+                cursor.execute(
+                    f"INSERT INTO {table} ({columns}) SELECT {columns} FROM {temp} "
+                    f"ON CONFLICT ({qn('content_hash')}) DO NOTHING "
+                    f"RETURNING {qn('content_hash')}"
+                )
+                inserted = {h for (h,) in cursor.fetchall()}
+        except DataError as e:
+            # bulk_create path retries row by row for error attribution
+            logger.warning("COPY batch rejected (%s); retrying it with bulk_create", e)
+            return super()._insert(batch)
+
+        result = StagingBatchResult(
+            written=[staging for _, staging in batch if staging.content_hash in inserted],
+            skipped=len(batch) - len(inserted),
+        )
+        self._report(len(result.written))
+        return result
 
 
 class DryRunWriter:
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-18 14:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mintcastiq', '0005_stagedset_stagedcard_stagedcardevent_stagedinventory_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='stagingchecklistrow',
+            name='content_hash',
+            field=models.CharField(blank=True, editable=False, help_text='SHA-256 of the canonicalized raw row plus provenance; duplicates are skipped.', max_length=64, null=True, unique=True),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.8 on 2026-10-18 14:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mintcastiq', '0006_stagingchecklistrow_content_hash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChecklistFileManifest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('path', models.CharField(max_length=1024, unique=True)),
+                ('size', models.BigIntegerField()),
+                ('mtime_ns', models.BigIntegerField()),
+                ('digest', models.CharField(max_length=64)),
+                ('last_ingested_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'checklist_file_manifest',
+            },
+        ),
+    ]
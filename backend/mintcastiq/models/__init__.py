@@ -60,6 +60,7 @@ from .bridge_player_team import BridgePlayerTeam
 # Import Checklist Ingest Models
 # -----------------------------
 from .checklist_upload import ChecklistUpload
+from .checklist_file_manifest import ChecklistFileManifest
 from .staging.staging_checklist_row import StagingChecklistRow
 from .fact_checklist_entry import FactChecklistEntry
 
@@ -68,7 +69,7 @@ __all__ = [
     "DimParallelSet", "DimCardParallel",
     "FactCardEvents", "FactInventory", "FactInventoryDetail",
     "FactPlayerMaster", "FactTeamMaster", "FactUsersOTP",
-    "BridgePlayerTeam", "ChecklistUpload", "StagingChecklistRow", "FactChecklistEntry",
+    "BridgePlayerTeam", "ChecklistUpload", "ChecklistFileManifest", "StagingChecklistRow", "FactChecklistEntry",
     "BaseIdentity", "SoftDeleteMixin", "ActiveManager",
     "StagedPlayerTeam", "StagedCardEvent", "StagedCard",
     "StagedInventoryDetail", "StagedInventory", "StagedParallel",
@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 from domain.hashing import hash_string
 
 
@@ -13,6 +13,7 @@ class BaseIdentity(models.Model):
     - Enforce identity immutability after creation
     - Provide canonicalize() hook for normalization
     - Provide create() helper for contributor-safe instantiation
+    - Provide bulk_upsert() for set-based, race-free creation
     """
 
     # Subclasses MUST override this with a tuple
@@ -55,6 +56,96 @@ class BaseIdentity(models.Model):
         instance.save()
         return instance
 
+    @classmethod
+    def bulk_upsert(cls, instances, batch_size=1000):
+        """
+        Set-based counterpart to create():
+        - canonicalizes fields and computes checksums
+        - INSERT ... ON CONFLICT on the model's unique constraint, so
+          existing rows are never overwritten and concurrent loaders
+          cannot race each other
+        - sets the pk of every instance, new or pre-existing
+
+        Conflicting rows are "updated" with their own key values only, so
+        stored identity and lifecycle fields are left untouched. If a
+        stored row's checksum differs from the incoming identity, or two
+        instances share a key but not an identity, a ValueError is raised
+        (identity immutability) and the whole batch is rolled back.
+
+        Instances sharing a key are collapsed; all of them get the same pk.
+        Returns the list of instances.
+        """
+        instances = list(instances)
+        if not instances:
+            return instances
+
+        unique_fields = cls._upsert_unique_fields()
+        key_attnames = [cls._meta.get_field(name).attname for name in unique_fields]
+
+        by_key = {}
+        for instance in instances:
+            instance.canonicalize()
+            instance._compute_checksum()
+            key = tuple(getattr(instance, attname) for attname in key_attnames)
+            group = by_key.setdefault(key, [])
+            if group and group[0].checksum != instance.checksum:
+                raise ValueError(
+                    f"Identity fields are immutable for {cls.__name__}. "
+                    f"Key {key} is given as both '{group[0].identity_string}' "
+                    f"and '{instance.identity_string}'."
+                )
+            group.append(instance)
+
+        representatives = [group[0] for group in by_key.values()]
+        # A conflict found after the insert must undo the batch's new rows too
+        with transaction.atomic():
+            cls.objects.bulk_create(
+                representatives,
+                batch_size=batch_size,
+                update_conflicts=True,
+                unique_fields=unique_fields,
+                update_fields=unique_fields,
+            )
+
+            stored = dict(
+                cls.objects
+                .filter(pk__in=[obj.pk for obj in representatives])
+                .values_list("pk", "checksum")
+            )
+            for obj in representatives:
+                existing = stored.get(obj.pk)
+                if existing and existing != obj.checksum:
+                    raise ValueError(
+                        f"Identity fields are immutable for {cls.__name__}. "
+                        f"Row {obj.pk} already exists with a different identity "
+                        f"than '{obj.identity_string}'."
+                    )
+
+        for group in by_key.values():
+            for duplicate in group[1:]:
+                duplicate.pk = group[0].pk
+                duplicate._state.adding = False
+                duplicate._state.db = group[0]._state.db
+
+        return instances
+
+    @classmethod
+    def _upsert_unique_fields(cls):
+        """
+        Field names of the constraint bulk_upsert() conflicts on: the first
+        unconditional UniqueConstraint, else the first unique=True field.
+        """
+        for constraint in cls._meta.constraints:
+            if isinstance(constraint, models.UniqueConstraint) and not constraint.condition \
+                    and constraint.fields:
+                return list(constraint.fields)
+
+        for field in cls._meta.concrete_fields:
+            if field.unique and not field.primary_key:
+                return [field.name]
+
+        raise TypeError(f"{cls.__name__} has no unique constraint to upsert on.")
+
     # ------------------------------------------------------------
     # Canonicalization hook
     # ------------------------------------------------------------
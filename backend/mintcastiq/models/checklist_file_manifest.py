@@ -0,0 +1,23 @@
+from django.db import models
+
+
+class ChecklistFileManifest(models.Model):
+    """
+    One entry per checklist file that has been fully staged. Lets the
+    ingest pipeline skip files whose contents have not changed since the
+    last successful run. The digest is only recomputed when the file's
+    size or mtime differs from the recorded values.
+    """
+
+    path = models.CharField(max_length=1024, unique=True)
+    size = models.BigIntegerField()
+    mtime_ns = models.BigIntegerField()
+    digest = models.CharField(max_length=64)
+
+    last_ingested_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "checklist_file_manifest"
+
+    def __str__(self):
+        return f"{self.path} ({self.digest[:12]})"
@@ -21,6 +21,16 @@ class StagingChecklistRow(models.Model):
     # --- Raw contributor input (never mutated) ---
     raw_row = models.JSONField(help_text="Original contributor input, unmodified.")
 
+    # --- Idempotency: hash of canonicalized raw_row (includes _file/_sheet/_row) ---
+    content_hash = models.CharField(
+        max_length=64,
+        unique=True,
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="SHA-256 of the canonicalized raw row plus provenance; duplicates are skipped.",
+    )
+
     # --- Normalized fields (safe to mutate during validation) ---
     normalized_set = models.CharField(max_length=200, null=True, blank=True)
     normalized_card_number = models.CharField(max_length=50, null=True, blank=True)
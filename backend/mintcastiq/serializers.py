@@ -1,6 +1,9 @@
 # serializers.py# 
 from rest_framework import serializers
 import json
+from functools import lru_cache
+from json.encoder import encode_basestring_ascii
+from operator import attrgetter
 from django.forms.models import model_to_dict 
 from django.db.models import Model
 
@@ -13,6 +16,61 @@ def serialize_for_hash(instance):
     return json.dumps(data, sort_keys=True, separators=(",", ":"))
 
 
+@lru_cache(maxsize=None)
+def identity_plan(model):
+    """
+    Per-model (key prefixes, accessor) for the canonical hash payload:
+    the identity fields model_to_dict would keep (editable concrete
+    fields), sorted by name, with each `"name":` key pre-encoded and an
+    attrgetter over their attnames (FKs hash by id, as in model_to_dict).
+    """
+    fields = getattr(model, "identity_fields", None)
+    if not fields:
+        raise ValueError(f"{model.__name__} must define IDENTITY_FIELDS")
+
+    opts = model._meta
+    selected = sorted(
+        (f.name, f.attname)
+        for f in (*opts.concrete_fields, *opts.private_fields)
+        if getattr(f, "editable", False) and f.name in fields
+    )
+    prefixes = tuple(
+        ("{" if i == 0 else ",") + encode_basestring_ascii(name) + ":"
+        for i, (name, _) in enumerate(selected)
+    )
+    attnames = [attname for _, attname in selected]
+    if not attnames:
+        return (), lambda instance: ()
+    getter = attrgetter(*attnames)
+    accessor = getter if len(attnames) > 1 else (lambda instance: (getter(instance),))
+    return prefixes, accessor
+
+
+def _encode_value(value):
+    # Matches json.dumps for the scalar types identity fields hold
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if type(value) is str:
+        return encode_basestring_ascii(value)
+    if type(value) is int:
+        return int.__repr__(value)
+    return json.dumps(value, separators=(",", ":"))
+
 
-  
-                                                                                                                                                                                                           
\ No newline at end of file
+def canonical_hash_payload(instance, plan=None) -> bytes:
+    """
+    Byte-identical to serialize_for_hash(instance).encode("utf-8"),
+    encoded straight from the precomputed identity_plan() without
+    model_to_dict or an intermediate dict. Batch callers may pass the
+    instance's plan to skip the lookup.
+    """
+    prefixes, accessor = plan or identity_plan(type(instance))
+    if not prefixes:
+        return b"{}"
+    parts = [prefix + _encode_value(value) for prefix, value in zip(prefixes, accessor(instance))]
+    parts.append("}")
+    return "".join(parts).encode("ascii")
@@ -0,0 +1,95 @@
+import pytest
+
+from mintcastiq.models import DimCard, DimCardParallel, DimParallel, DimSet
+
+
+@pytest.mark.django_db
+class TestBulkUpsert:
+
+    def _set(self, code="2024-Panini-Select-Football-Base"):
+        return DimSet.create(
+            set_name="Select",
+            publisher="Panini",
+            set_year="2024",
+            subset_name="Base",
+            sport="Football",
+            set_code=code,
+        )
+
+    def test_inserts_new_rows_and_sets_pks(self):
+        parallels = DimParallel.bulk_upsert(
+            [DimParallel(parallel_name=name) for name in ("Gold", "Silver", "Blue")]
+        )
+
+        assert all(p.pk for p in parallels)
+        assert DimParallel.objects.count() == 3
+        assert DimParallel.objects.get(parallel_name="Gold").checksum == parallels[0].checksum
+
+    def test_returns_pks_of_existing_rows_without_overwriting(self):
+        dim_set = self._set()
+        existing = DimCard.create(cardset=dim_set, card_number="1", name="Mike Trout", team_name="Angels")
+
+        cards = DimCard.bulk_upsert([
+            DimCard(cardset=dim_set, card_number="1", name="Someone Else", team_name="Other"),
+            DimCard(cardset=dim_set, card_number="2", name="Aaron Judge", team_name="Yankees"),
+        ])
+
+        assert cards[0].pk == existing.pk
+        assert DimCard.objects.get(pk=existing.pk).name == "Mike Trout"
+        assert DimCard.objects.count() == 2
+
+    def test_duplicate_keys_share_a_pk(self):
+        parallels = DimParallel.bulk_upsert([DimParallel(parallel_name="Gold"), DimParallel(parallel_name="Gold")])
+
+        assert parallels[0].pk == parallels[1].pk
+        assert DimParallel.objects.count() == 1
+
+    def test_upserts_on_foreign_key_constraints(self):
+        dim_set = self._set()
+        card = DimCard.create(cardset=dim_set, card_number="1", name="Mike Trout", team_name="Angels")
+        gold = DimParallel.create(parallel_name="Gold")
+
+        first = DimCardParallel.bulk_upsert([DimCardParallel(card=card, parallel=gold)])
+        second = DimCardParallel.bulk_upsert([DimCardParallel(card=card, parallel=gold)])
+
+        assert first[0].pk == second[0].pk
+        assert DimCardParallel.objects.count() == 1
+
+    def test_conflicting_identity_raises(self):
+        self._set()
+
+        with pytest.raises(ValueError):
+            DimSet.bulk_upsert([DimSet(
+                set_name="Prizm",
+                publisher="Panini",
+                set_year="2024",
+                subset_name="Base",
+                sport="Football",
+                set_code="2024-Panini-Select-Football-Base",
+            )])
+
+    def test_duplicate_keys_with_different_identities_raise(self):
+        def dim_set(name):
+            return DimSet(set_name=name, publisher="Panini", set_year="2024",
+                          subset_name="Base", sport="Football", set_code="X")
+
+        with pytest.raises(ValueError, match="given as both"):
+            DimSet.bulk_upsert([dim_set("Select"), dim_set("Prizm")])
+        assert not DimSet.objects.exists()
+
+    def test_conflict_rolls_back_the_whole_batch(self):
+        self._set()
+
+        with pytest.raises(ValueError):
+            DimSet.bulk_upsert([
+                DimSet(set_name="Mosaic", publisher="Panini", set_year="2024",
+                       subset_name="Base", sport="Football", set_code="new-set"),
+                DimSet(set_name="Prizm", publisher="Panini", set_year="2024",
+                       subset_name="Base", sport="Football", set_code="2024-Panini-Select-Football-Base"),
+            ])
+
+        assert not DimSet.objects.filter(set_code="new-set").exists()
+
+    def test_incomplete_identity_raises(self):
+        with pytest.raises(ValueError):
+            DimSet.bulk_upsert([DimSet(set_name="Select", set_code="X")])
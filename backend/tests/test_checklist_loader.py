@@ -0,0 +1,120 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from domain.ingest.checklist_loader import ChecklistLoader
+from mintcastiq.models import DimCard, DimCardParallel, DimParallel, DimSet, FactChecklistEntry
+from mintcastiq.models.staging.staging_checklist_row import StagingChecklistRow, StagingStatus
+
+
+def _stage(n, set_name="2024 Panini Select", parallel=None, offset=0):
+    StagingChecklistRow.objects.bulk_create([
+        StagingChecklistRow(
+            raw_row={"_file": "select.xlsx", "_sheet": "Base", "_row": i + 2, "team_name": "Team"},
+            normalized_set=set_name,
+            normalized_card_number=str(i + offset),
+            normalized_player=f"Player {i}",
+            normalized_parallel=parallel,
+            status=StagingStatus.VALIDATED,
+        )
+        for i in range(n)
+    ])
+
+
+@pytest.mark.django_db
+class TestChecklistLoader:
+
+    def test_loads_dimensions_and_facts(self):
+        _stage(3)
+        _stage(3, parallel="Gold Prizm")
+
+        loaded = ChecklistLoader(chunk_size=4).load_validated_rows()
+
+        assert loaded == 6
+        assert DimSet.objects.count() == 1
+        assert DimCard.objects.count() == 3
+        assert set(DimParallel.objects.values_list("parallel_name", flat=True)) == {"Base", "Gold Prizm"}
+        assert DimCardParallel.objects.count() == 6
+        assert FactChecklistEntry.objects.count() == 6
+        assert not StagingChecklistRow.objects.exclude(status=StagingStatus.LOADED).exists()
+
+        entry = FactChecklistEntry.objects.order_by("id").first()
+        assert (entry.source_file, entry.source_sheet, entry.source_row) == ("select.xlsx", "Base", 2)
+
+    def test_reuses_existing_dimensions(self):
+        _stage(2)
+        ChecklistLoader().load_validated_rows()
+        _stage(2)
+
+        ChecklistLoader().load_validated_rows()
+
+        assert DimCard.objects.count() == 2
+        assert DimCardParallel.objects.count() == 2
+        assert FactChecklistEntry.objects.count() == 4
+
+    def test_rows_missing_keys_are_marked_error(self):
+        _stage(1)
+        StagingChecklistRow.objects.update(normalized_card_number=None)
+
+        assert ChecklistLoader().load_validated_rows() == 0
+
+        row = StagingChecklistRow.objects.get()
+        assert row.status == StagingStatus.ERROR
+        assert row.error_message == "Missing normalized card number"
+        assert row.processed_at is not None
+
+    def test_query_count_is_constant_per_chunk(self):
+        _stage(5, parallel="Gold")
+        with CaptureQueriesContext(connection) as small:
+            ChecklistLoader(chunk_size=100).load_validated_rows()
+
+        _stage(60, set_name="2024 Topps Chrome", parallel="Silver", offset=1000)
+        with CaptureQueriesContext(connection) as large:
+            ChecklistLoader(chunk_size=100).load_validated_rows()
+
+        assert len(large.captured_queries) == len(small.captured_queries)
+
+    def test_staging_rows_are_updated_once_per_chunk(self):
+        _stage(30)
+
+        with CaptureQueriesContext(connection) as ctx:
+            ChecklistLoader(chunk_size=10).load_validated_rows()
+
+        staging_updates = [
+            q["sql"] for q in ctx.captured_queries
+            if q["sql"].startswith('UPDATE "mintcastiq_stagingchecklistrow"')
+        ]
+        assert len(staging_updates) == 3
+
+    def test_parallel_workers_fall_back_to_sequential_without_postgres(self):
+        _stage(10)
+
+        assert ChecklistLoader(chunk_size=3, workers=4).load_validated_rows() == 10
+        assert FactChecklistEntry.objects.count() == 10
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="SKIP LOCKED claiming requires PostgreSQL")
+def test_parallel_workers_load_each_row_once():
+    for set_index in range(4):
+        _stage(25, set_name=f"Set {set_index}", parallel="Gold", offset=set_index * 100)
+
+    loaded = ChecklistLoader(chunk_size=10, workers=4).load_validated_rows()
+
+    assert loaded == 100
+    assert FactChecklistEntry.objects.count() == 100
+    assert DimParallel.objects.filter(parallel_name="Gold").count() == 1
+    assert not StagingChecklistRow.objects.exclude(status=StagingStatus.LOADED).exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="Advisory locks require PostgreSQL")
+def test_set_locks_are_taken_in_one_statement():
+    for set_index in range(5):
+        _stage(2, set_name=f"Set {set_index}", offset=set_index * 100)
+
+    with CaptureQueriesContext(connection) as ctx:
+        ChecklistLoader(chunk_size=100).load_validated_rows()
+
+    locks = [q["sql"] for q in ctx.captured_queries if "pg_advisory_xact_lock" in q["sql"]]
+    assert len(locks) == 1
@@ -0,0 +1,77 @@
+import os
+
+import pytest
+
+from domain.ingest.manifest import ChecklistManifest
+from domain.ingest.parsers.dispatcher import ChecklistParserDispatcher
+from mintcastiq.models import ChecklistFileManifest
+
+
+@pytest.mark.django_db
+class TestChecklistManifest:
+
+    def _write(self, path, text):
+        path.write_text(text, encoding="utf-8")
+        return path
+
+    def test_unrecorded_file_is_parsed(self, tmp_path):
+        path = self._write(tmp_path / "a.csv", "card_number\n1\n")
+
+        assert ChecklistManifest().should_parse(path) is True
+
+    def test_recorded_file_is_skipped_until_content_changes(self, tmp_path):
+        path = self._write(tmp_path / "a.csv", "card_number\n1\n")
+        manifest = ChecklistManifest()
+        manifest.should_parse(path)
+        manifest.record_all()
+
+        assert ChecklistFileManifest.objects.count() == 1
+        assert ChecklistManifest().should_parse(path) is False
+
+        self._write(path, "card_number\n1\n2\n")
+        assert ChecklistManifest().should_parse(path) is True
+
+    def test_touched_but_identical_file_is_skipped_and_restamped(self, tmp_path):
+        path = self._write(tmp_path / "a.csv", "card_number\n1\n")
+        manifest = ChecklistManifest()
+        manifest.should_parse(path)
+        manifest.record_all()
+
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+        assert ChecklistManifest().should_parse(path) is False
+        assert ChecklistFileManifest.objects.get().mtime_ns == path.stat().st_mtime_ns
+
+    def test_force_parses_unchanged_files(self, tmp_path):
+        path = self._write(tmp_path / "a.csv", "card_number\n1\n")
+        manifest = ChecklistManifest()
+        manifest.should_parse(path)
+        manifest.record_all()
+
+        assert ChecklistManifest(force=True).should_parse(path) is True
+
+    def test_failed_files_are_not_recorded(self, tmp_path):
+        good = self._write(tmp_path / "good.csv", "card_number\n1\n")
+        bad = self._write(tmp_path / "bad.csv", "card_number\n1\n")
+        manifest = ChecklistManifest()
+        manifest.should_parse(good)
+        manifest.should_parse(bad)
+
+        manifest.record_all(skip_names={"bad.csv"})
+
+        assert list(ChecklistFileManifest.objects.values_list("path", flat=True)) == [
+            str(good.resolve())
+        ]
+
+    def test_dispatcher_skips_unchanged_files(self, tmp_path):
+        self._write(tmp_path / "a.csv", "card_number\n1\n")
+        self._write(tmp_path / "b.csv", "card_number\n2\n")
+        manifest = ChecklistManifest()
+        list(ChecklistParserDispatcher(tmp_path, manifest=manifest).parse())
+        manifest.record_all()
+
+        self._write(tmp_path / "b.csv", "card_number\n3\n")
+        rows = list(ChecklistParserDispatcher(tmp_path, manifest=ChecklistManifest()).parse())
+
+        assert [(r["_file"], r["card_number"]) for r in rows] == [("b.csv", "3")]
@@ -0,0 +1,67 @@
+import pytest
+
+from domain.ingest.checklist_normalization_service import ChecklistNormalizationService
+
+
+class TestChecklistNormalizationBatch:
+
+    def test_batch_matches_row_by_row(self):
+        rows = [
+            {"set_name": " 2025 topps baseball ", "card_number": " 23a ", "player_name": "mike  trout", "parallel": "rainbow foil"},
+            {"set_name": "2025 topps baseball", "card_number": 7, "player_name": "aaron judge", "parallel": None},
+        ]
+
+        normalized, errors = ChecklistNormalizationService.run_batch(rows)
+
+        assert errors == [None, None]
+        assert normalized == [ChecklistNormalizationService(row).run() for row in rows]
+
+    def test_errors_are_collected_per_row(self):
+        rows = [
+            {"set_name": "2025 Topps", "card_number": "1", "player_name": "Mike Trout"},
+            {"set_name": None, "card_number": None, "player_name": "Mike Trout"},
+            {"set_name": "2025 Topps", "card_number": "2", "player_name": ""},
+        ]
+
+        normalized, errors = ChecklistNormalizationService.run_batch(rows)
+
+        assert normalized[0]["card_number"] == "1"
+        assert normalized[1] is None and normalized[2] is None
+        assert errors == [None, "Missing set name", "Missing player name"]
+
+    def test_columns_api_distinguishes_equal_numbers_of_different_types(self):
+        out, errors = ChecklistNormalizationService.run_columns({
+            "set_name": ["2025 Topps"] * 2,
+            "card_number": [1, 1.0],
+            "player_name": ["Mike Trout"] * 2,
+        })
+
+        assert out["card_number"] == ["1", "1.0"]
+        assert out["parallel"] == [None, None]
+        assert errors == [None, None]
+
+    def test_batch_as_columns_skips_row_dicts(self):
+        rows = [
+            {"set_name": "2025 topps", "card_number": "1", "player_name": "mike trout"},
+            {"set_name": "2025 topps", "card_number": None, "player_name": "aaron judge"},
+        ]
+
+        columns, errors = ChecklistNormalizationService.run_batch(rows, as_columns=True)
+
+        assert columns["set"] == ["2025 Topps", "2025 Topps"]
+        assert columns["card_number"] == ["1", None]
+        assert errors == [None, "Missing card number"]
+
+    def test_staging_values_keep_partially_normalized_rows(self):
+        rows = [{"set_name": None, "card_number": " 7b ", "player_name": "mike  trout", "parallel": "gold"}]
+
+        assert ChecklistNormalizationService.run_staging(rows) == {
+            "set": [None], "card_number": ["7B"], "player": ["Mike Trout"], "parallel": ["Gold"],
+        }
+        assert ChecklistNormalizationService.run_staging([]) == {
+            "set": [], "card_number": [], "player": [], "parallel": [],
+        }
+
+    def test_single_row_api_still_raises(self):
+        with pytest.raises(ValueError):
+            ChecklistNormalizationService({"card_number": "1"}).run()
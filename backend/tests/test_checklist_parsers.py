@@ -0,0 +1,218 @@
+import io
+import json
+import queue
+import threading
+
+import openpyxl
+import pytest
+
+from domain.ingest.parsers.csv_parser import CSVChecklistParser
+from domain.ingest.parsers.dispatcher import ChecklistParserDispatcher, _parse_unit
+from domain.ingest.parsers.excel_parser import ExcelChecklistParser
+from domain.ingest.parsers.json_parser import JSONChecklistParser, _JSONStream
+
+
+def _write_workbook(path, sheets):
+    wb = openpyxl.Workbook()
+    wb.remove(wb.active)
+    for title, rows in sheets.items():
+        ws = wb.create_sheet(title)
+        for row in rows:
+            ws.append(row)
+    wb.save(path)
+    return path
+
+
+class TestExcelChecklistParser:
+
+    def test_streams_rows_from_every_sheet(self, tmp_path):
+        path = _write_workbook(tmp_path / "checklist.xlsx", {
+            "Base": [
+                ("card_number", "player_name"),
+                ("1", "Mike Trout"),
+                ("2", "Shohei Ohtani"),
+            ],
+            "Inserts": [
+                ("card_number", "player_name"),
+                ("I-1", "Aaron Judge"),
+            ],
+        })
+
+        rows = list(ExcelChecklistParser(path).parse())
+
+        assert [(r["_sheet"], r["_row"], r["card_number"]) for r in rows] == [
+            ("Base", 2, "1"),
+            ("Base", 3, "2"),
+            ("Inserts", 2, "I-1"),
+        ]
+        assert rows[0]["player_name"] == "Mike Trout"
+
+    def test_skips_empty_sheets(self, tmp_path):
+        path = _write_workbook(tmp_path / "checklist.xlsx", {
+            "Empty": [],
+            "Base": [("card_number",), ("1",)],
+        })
+
+        rows = list(ExcelChecklistParser(path).parse())
+
+        assert [r["_sheet"] for r in rows] == ["Base"]
+
+    def test_parse_is_lazy(self, tmp_path):
+        path = _write_workbook(tmp_path / "checklist.xlsx", {
+            "Base": [("card_number",)] + [(str(i),) for i in range(100)],
+        })
+
+        rows = ExcelChecklistParser(path).parse()
+
+        assert next(rows)["card_number"] == "0"
+        rows.close()
+
+
+class TestCSVChecklistParser:
+
+    def test_rows_carry_record_numbers(self, tmp_path):
+        path = tmp_path / "checklist.csv"
+        path.write_text("card_number,player_name\n1,Mike Trout\n2, \n", encoding="utf-8")
+
+        assert list(CSVChecklistParser(path).parse()) == [
+            {"card_number": "1", "player_name": "Mike Trout", "_row": 2},
+            {"card_number": "2", "player_name": None, "_row": 3},
+        ]
+
+
+class TestJSONChecklistParser:
+
+    def test_streams_top_level_array(self, tmp_path):
+        path = tmp_path / "checklist.json"
+        rows = [{"card_number": str(i), "player_name": f"Player {i}", "print_run": i * 10} for i in range(50)]
+        path.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+
+        # A tiny chunk size forces elements to straddle buffer refills
+        parsed = list(JSONChecklistParser(path, chunk_size=7).parse())
+
+        assert parsed == [dict(row, _row=i + 1) for i, row in enumerate(rows)]
+
+    def test_streams_checklist_and_parallels_sections(self, tmp_path):
+        path = tmp_path / "checklist.json"
+        path.write_text(json.dumps({
+            "version": 2,
+            "checklist": [{"cardNumber": "1"}, {"cardNumber": "2"}],
+            "parallels": [{"parallel": "Gold"}],
+        }), encoding="utf-8")
+
+        parsed = list(JSONChecklistParser(path, chunk_size=5).parse())
+
+        assert parsed == [
+            {"cardNumber": "1", "_section": "checklist", "_row": 1},
+            {"cardNumber": "2", "_section": "checklist", "_row": 2},
+            {"parallel": "Gold", "_section": "parallels", "_row": 1},
+        ]
+
+    def test_empty_array_yields_nothing(self, tmp_path):
+        path = tmp_path / "checklist.json"
+        path.write_text("[ ]", encoding="utf-8")
+
+        assert list(JSONChecklistParser(path).parse()) == []
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 8, 13])
+    def test_values_split_at_any_chunk_boundary(self, tmp_path, chunk_size):
+        path = tmp_path / "checklist.json"
+        rows = [
+            {"n": -12.5e3, "t": True, "f": False, "z": None, "s": "caf\u00e9 \U0001f3c8 \"q\""},
+            {"inf": float("-inf"), "nested": [1, {"x": "y"}]},
+        ]
+        path.write_text(json.dumps(rows), encoding="utf-8")
+
+        parsed = list(JSONChecklistParser(path, chunk_size=chunk_size).parse())
+
+        assert parsed == [dict(row, _row=i + 1) for i, row in enumerate(rows)]
+
+    def test_malformed_element_fails_fast_with_file_offset(self):
+        text = '[{"card_number": "1"}, {"card_number": 2,, "x": 1}' + ', {"card_number": "3"}' * 10_000 + "]"
+        f = io.StringIO(text)
+        stream = _JSONStream(f, chunk_size=64)
+        rows = stream.iter_array()
+
+        assert next(rows) == {"card_number": "1"}
+        with pytest.raises(ValueError, match=f"offset {text.index(',,') + 1}:"):
+            next(rows)
+        assert f.tell() < 1024
+
+    def test_oversized_element_is_rejected(self, monkeypatch):
+        monkeypatch.setattr(_JSONStream, "MAX_ELEMENT_CHARS", 100)
+        stream = _JSONStream(io.StringIO('["' + "x" * 1000 + '"]'), chunk_size=16)
+
+        with pytest.raises(ValueError, match="exceeds 100 characters"):
+            list(stream.iter_array())
+
+    def test_rejects_scalar_document(self, tmp_path):
+        path = tmp_path / "checklist.json"
+        path.write_text("42", encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            list(JSONChecklistParser(path).parse())
+
+
+class TestChecklistParserDispatcher:
+
+    def _populate(self, directory):
+        _write_workbook(directory / "a-checklist.xlsx", {
+            "Base": [("card_number",)] + [(str(i),) for i in range(1200)],
+            "Inserts": [("card_number",)] + [(f"I-{i}",) for i in range(700)],
+        })
+        (directory / "b-checklist.csv").write_text(
+            "card_number,player_name\n1,Mike Trout\n2,Aaron Judge\n", encoding="utf-8"
+        )
+        (directory / "c-checklist.json").write_text(
+            json.dumps([{"card_number": "J-1"}]), encoding="utf-8"
+        )
+        (directory / "notes.txt").write_text("ignored", encoding="utf-8")
+
+    @staticmethod
+    def _by_file(rows):
+        grouped = {}
+        for row in rows:
+            grouped.setdefault(row["_file"], []).append(row)
+        return grouped
+
+    def test_parallel_matches_sequential_per_file(self, tmp_path):
+        self._populate(tmp_path)
+
+        sequential = list(ChecklistParserDispatcher(tmp_path).parse())
+        parallel = list(ChecklistParserDispatcher(tmp_path, workers=3, queue_depth=2).parse())
+
+        assert len(sequential) == 1200 + 700 + 2 + 1
+        assert self._by_file(parallel) == self._by_file(sequential)
+
+    def test_parallel_with_minimal_unit_depth(self, tmp_path):
+        self._populate(tmp_path)
+
+        sequential = list(ChecklistParserDispatcher(tmp_path).parse())
+        parallel = list(ChecklistParserDispatcher(tmp_path, workers=2, unit_depth=1).parse())
+
+        assert self._by_file(parallel) == self._by_file(sequential)
+
+    def test_unit_blocks_when_out_of_credits(self, tmp_path):
+        path = _write_workbook(tmp_path / "a.xlsx", {
+            "Base": [("card_number",)] + [(str(i),) for i in range(100)],
+        })
+        rows_queue, credits, stop = queue.Queue(), threading.Semaphore(2), threading.Event()
+        worker = threading.Thread(
+            target=_parse_unit, args=(0, str(path), "Base", rows_queue, credits, stop, 10),
+        )
+        worker.start()
+        worker.join(timeout=1.5)
+
+        # Two credits: two batches sent, then the worker waits for the consumer
+        assert worker.is_alive()
+        assert rows_queue.qsize() == 2
+
+        stop.set()
+        worker.join()
+        assert rows_queue.qsize() == 2
+
+    def test_parallel_reports_parse_errors(self, tmp_path):
+        (tmp_path / "broken.json").write_text("[{", encoding="utf-8")
+
+        with pytest.raises(RuntimeError, match="broken.json"):
+            list(ChecklistParserDispatcher(tmp_path, workers=2).parse())
@@ -0,0 +1,62 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from domain.ingest.checklist_validation_service import ChecklistValidationService, ValidationReferences
+from mintcastiq.models import DimParallel
+from mintcastiq.models.staging.staging_checklist_row import StagingChecklistRow, StagingStatus
+
+
+def _stage(n, parallel="Gold Prizm", card_number=None):
+    StagingChecklistRow.objects.bulk_create([
+        StagingChecklistRow(
+            raw_row={"_row": i + 2},
+            normalized_set="2024 Panini Select",
+            normalized_card_number=card_number or str(i + 1),
+            normalized_player=f"Player {i}",
+            normalized_parallel=parallel,
+        )
+        for i in range(n)
+    ])
+
+
+@pytest.mark.django_db
+class TestChecklistValidationBatch:
+
+    def test_validate_pending_sets_status_and_errors(self):
+        DimParallel.objects.create(parallel_name="Gold Prizm")
+        _stage(2)
+        _stage(1, parallel="Mystery Foil")
+        _stage(1, card_number="--")
+
+        validated, failed = ChecklistValidationService.validate_pending(chunk_size=3)
+
+        assert (validated, failed) == (2, 2)
+        errors = sorted(
+            StagingChecklistRow.objects.filter(status=StagingStatus.ERROR)
+            .values_list("error_message", flat=True)
+        )
+        assert errors == ["Invalid card number: --", "Unknown parallel: Mystery Foil"]
+        assert not StagingChecklistRow.objects.filter(processed_at__isnull=True).exists()
+
+    def test_query_count_is_constant_per_chunk(self):
+        DimParallel.objects.create(parallel_name="Gold Prizm")
+
+        def run(n):
+            StagingChecklistRow.objects.all().delete()
+            _stage(n)
+            with CaptureQueriesContext(connection) as ctx:
+                ChecklistValidationService.validate_pending(chunk_size=100)
+            return len(ctx.captured_queries)
+
+        assert run(5) == run(60)
+
+    def test_single_row_run_uses_preloaded_references(self):
+        _stage(1)
+        row = StagingChecklistRow.objects.get()
+
+        ChecklistValidationService(row, ValidationReferences(parallels={"Gold Prizm"})).run()
+
+        row.refresh_from_db()
+        assert row.status == StagingStatus.VALIDATED
+        assert row.error_message is None
@@ -0,0 +1,478 @@
+import copy
+import json
+import os
+import pickle
+import queue
+import threading
+
+import openpyxl
+import pytest
+import yaml
+
+from domain.ingest import checklists
+from domain.ingest.checklists import (
+    ChecklistCard,
+    ChecklistConfigRegistry,
+    classify_row,
+    collect_result,
+    compile_checklist,
+    config,
+    ingest_checklist,
+    ingest_workbook,
+    iter_workbook_parallel,
+    process_workbook,
+    record_json,
+    result_json,
+    run_workbooks,
+    write_workbook_ndjson,
+)
+from benchmarks.bench_classify_row import legacy_classify_row, synthetic_sheet
+
+
+FILENAME = "2024-Panini-Select-Football-Checklist.xlsx"
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    wb = openpyxl.Workbook()
+    wb.remove(wb.active)
+
+    teams = wb.create_sheet("Teams")
+    teams.append(["Arizona Cardinals"])
+    teams.append(["TM", "1", "Kyler Murray", "Arizona Cardinals", None, "/99"])
+    teams.append(["Parallels"])
+    teams.append(["Gold"])
+    teams.append(["TM", "2", "James Conner", "Arizona Cardinals", None, None])
+
+    base = wb.create_sheet("Base")
+    base.append(["7", "Josh Allen", "Buffalo Bills", "25"])
+
+    wb.create_sheet("Not Configured").append(["ignored"])
+
+    path = tmp_path / FILENAME
+    wb.save(path)
+
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    yield wb
+    wb.close()
+
+
+class TestChecklistIngest:
+
+    def test_streams_cards_and_parallels_with_subsets(self, workbook):
+        result = ingest_workbook(workbook, FILENAME, config)
+
+        assert list(result["cards"]) == [
+            "2024-Panini-Select-TM-1",
+            "2024-Panini-Select-TM-2",
+            "2024-Panini-Select-7",
+        ]
+        subset = result["subsets"]["2024-Panini-Select-Arizona Cardinals"]
+        card = result["cards"]["2024-Panini-Select-TM-1"]
+        assert card.vals["player_name"] == "Kyler Murray"
+        assert card.vals["print_run"] == "/99"
+        assert card.cardset is subset
+
+        assert list(result["parallels"]) == ["2024-Panini-Select-Gold"]
+        assert result["parallels"]["2024-Panini-Select-Gold"].cardset is subset
+
+    def test_card_rows_use_the_cards_column_section(self, workbook):
+        card = ingest_workbook(workbook, FILENAME, config)["cards"]["2024-Panini-Select-7"]
+
+        assert card.vals == {
+            "card_number": "7", "player_name": "Josh Allen", "team_name": "Buffalo Bills", "print_run": "25",
+        }
+        assert card.cardset is None
+
+    def test_single_sheet_falls_back_to_top_level_defaults(self, workbook):
+        cfg = {"meta": {"set_name": "Select", "year": 2024, "brand": "Panini"}, "sheets": {0: {"name": "Base"}}}
+
+        result = ingest_checklist(workbook["Base"], FILENAME, "Base", cfg, config["defaults"])
+
+        card = result["cards"]["2024-Panini-Select-7"]
+        assert card.vals["player_name"] == "Josh Allen"
+        assert card.vals["print_run"] == "25"
+
+    def test_json_references_subsets_by_id(self, workbook):
+        result = ingest_workbook(workbook, FILENAME, config)
+
+        data = json.loads(json.dumps(result_json(result), default=record_json))
+
+        assert data["meta"]["set_name"] == "Select"
+        assert data["subsets"] == {
+            "2024-Panini-Select-Arizona Cardinals": {
+                "subset_name": "Arizona Cardinals", "card_number": "", "player_name": "",
+                "team_name": "", "print_run": "",
+            },
+        }
+        assert data["cards"]["2024-Panini-Select-TM-2"]["cardset"] == "2024-Panini-Select-Arizona Cardinals"
+        assert data["cards"]["2024-Panini-Select-7"] == {
+            "card_number": "7", "player_name": "Josh Allen", "team_name": "Buffalo Bills",
+            "print_run": "25", "parallel": None, "cardset": None,
+        }
+
+    def test_records_are_compact(self, workbook):
+        card = ingest_workbook(workbook, FILENAME, config)["cards"]["2024-Panini-Select-7"]
+
+        assert not hasattr(card, "__dict__")
+
+    def test_unknown_checklist_is_empty(self, workbook):
+        assert ingest_workbook(workbook, "Unknown.xlsx", config) == {
+            "meta": {}, "subsets": {}, "cards": {}, "parallels": {},
+        }
+
+
+class TestNdjsonOutput:
+
+    def test_streams_header_meta_and_records(self, workbook, tmp_path):
+        out = tmp_path / "out.ndjson"
+        with open(out, "w", encoding="utf-8") as f:
+            counts = write_workbook_ndjson(workbook, FILENAME, config, f)
+
+        lines = out.read_text(encoding="utf-8").splitlines()
+        records = [json.loads(line) for line in lines]
+
+        assert counts == {"subsets": 1, "cards": 3, "parallels": 1}
+        assert records[0] == {"type": "header", "source_file": FILENAME, **counts}
+        assert records[1]["type"] == "meta" and records[1]["set_name"] == "Select"
+        assert [(r["type"], r["key"]) for r in records[2:]] == [
+            ("subset", "2024-Panini-Select-Arizona Cardinals"),
+            ("card", "2024-Panini-Select-TM-1"),
+            ("parallel", "2024-Panini-Select-Gold"),
+            ("card", "2024-Panini-Select-TM-2"),
+            ("card", "2024-Panini-Select-7"),
+        ]
+        assert records[3]["cardset"] == "2024-Panini-Select-Arizona Cardinals"
+        assert all(": " not in line for line in lines[1:])
+
+    def test_records_match_json_output(self, workbook, tmp_path):
+        out = tmp_path / "out.ndjson"
+        with open(out, "w", encoding="utf-8") as f:
+            write_workbook_ndjson(workbook, FILENAME, config, f)
+        streamed = {
+            r["key"]: {k: v for k, v in r.items() if k not in ("type", "key")}
+            for r in map(json.loads, out.read_text(encoding="utf-8").splitlines()[2:])
+        }
+
+        result = json.loads(json.dumps(result_json(ingest_workbook(workbook, FILENAME, config)), default=record_json))
+
+        assert streamed == {**result["subsets"], **result["cards"], **result["parallels"]}
+
+    def test_counts_distinct_keys_like_json_output(self, tmp_path):
+        wb = openpyxl.Workbook()
+        base = wb.active
+        base.title = "Base"
+        base.append(["7", "Josh Allen", "Buffalo Bills", "25"])
+        base.append(["7", "Josh Allen", "Buffalo Bills", "10"])
+        base.append(["8", "Dak Prescott", "Dallas Cowboys", "25"])
+
+        out = tmp_path / "out.ndjson"
+        with open(out, "w", encoding="utf-8") as f:
+            counts = write_workbook_ndjson(wb, FILENAME, config, f)
+
+        result = ingest_workbook(wb, FILENAME, config)
+        assert counts == {kind: len(result[kind]) for kind in ("subsets", "cards", "parallels")}
+        assert counts["cards"] == 2
+        assert json.loads(out.read_text(encoding="utf-8").splitlines()[0])["cards"] == 2
+
+
+class CrashingConfig(dict):
+    """
+    Top-level config whose lookup kills the worker process for one workbook.
+    """
+
+    CRASH_KEY = "2024-Panini-Crash-Football-Checklist"
+
+    def get(self, key, default=None):
+        if key == self.CRASH_KEY:
+            os._exit(1)
+        return super().get(key, default)
+
+
+class FailingPlans(dict):
+    """
+    Sheet plans whose lookup fails inside a sheet worker.
+    """
+
+    def get(self, key, default=None):
+        raise ValueError("no plans")
+
+
+class TestRunWorkbooks:
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_failures_are_isolated_per_workbook(self, workbook, tmp_path, workers):
+        broken = tmp_path / "2024-Panini-Illusions-Football-Checklist.xlsx"
+        broken.write_bytes(b"not a workbook")
+        paths = [str(broken), str(tmp_path / FILENAME)]
+
+        reports = list(run_workbooks(paths, config, "ndjson", workers=workers))
+
+        assert [r["file"] for r in reports] == [broken.name, FILENAME]
+        assert "error" in reports[0]
+        assert (reports[1]["cards"], reports[1]["parallels"]) == (3, 1)
+        assert reports[1]["seconds"] >= 0
+        assert reports[1]["output"] == str(tmp_path / "2024-Panini-Select-Football-Checklist.ndjson")
+        with open(reports[1]["output"], encoding="utf-8") as f:
+            assert json.loads(f.readline())["cards"] == 3
+
+
+    def test_dead_worker_fails_only_its_workbook(self, workbook, tmp_path):
+        crash = tmp_path / f"{CrashingConfig.CRASH_KEY}.xlsx"
+        crash.write_bytes(b"never opened")
+        copies = []
+        for i in range(3):
+            copy_path = tmp_path / f"copy-{i}" / FILENAME
+            copy_path.parent.mkdir()
+            copy_path.write_bytes((tmp_path / FILENAME).read_bytes())
+            copies.append(str(copy_path))
+        paths = [copies[0], str(crash), *copies[1:]]
+
+        reports = list(run_workbooks(paths, CrashingConfig(config), "ndjson", workers=2))
+
+        assert [r["file"] for r in reports] == [os.path.basename(p) for p in paths]
+        assert "BrokenProcessPool" in reports[1]["error"]
+        for report in reports[:1] + reports[2:]:
+            assert "error" not in report
+            assert report["cards"] == 3
+
+
+class TestSheetParallelism:
+
+    @pytest.fixture
+    def path(self, tmp_path):
+        wb = openpyxl.Workbook()
+        wb.remove(wb.active)
+        for name, card in (("Teams", "1"), ("Master Checklist", "2"), ("Base", "3")):
+            ws = wb.create_sheet(name)
+            ws.append(["Arizona Cardinals"])
+            ws.append(["TM", card, f"Player {card}", "Arizona Cardinals", "/99"])
+        path = tmp_path / FILENAME
+        wb.save(path)
+        return str(path)
+
+    @pytest.mark.parametrize("fmt", ["json", "ndjson"])
+    def test_output_matches_sequential_run(self, path, fmt):
+        out = path.replace(".xlsx", f".{fmt}")
+
+        process_workbook(path, config, fmt)
+        with open(out, encoding="utf-8") as f:
+            sequential = f.read()
+        process_workbook(path, config, fmt, sheet_workers=2)
+        with open(out, encoding="utf-8") as f:
+            assert f.read() == sequential
+
+    def test_subsets_are_shared_across_sheets(self, path):
+        cfg, plans = checklists.resolve_checklist(config, FILENAME)
+
+        result = collect_result(cfg["meta"], iter_workbook_parallel(path, FILENAME, cfg, plans, 2))
+
+        subset = result["subsets"]["2024-Panini-Select-Arizona Cardinals"]
+        assert len(result["subsets"]) == 1
+        assert all(card.cardset is subset for card in result["cards"].values())
+
+    def test_small_chunks_match_sequential_run(self, path):
+        cfg, plans = checklists.resolve_checklist(config, FILENAME)
+        wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+        sequential = [(kind, k) for kind, k, _ in checklists._iter_sheets(wb, FILENAME, cfg, plans)]
+        wb.close()
+
+        streamed = iter_workbook_parallel(path, FILENAME, cfg, plans, 2, chunk_size=1)
+
+        assert [(kind, k) for kind, k, _ in streamed] == sequential
+
+    def test_sheet_worker_blocks_when_its_queue_is_full(self, path):
+        cfg, plans = checklists.resolve_checklist(config, FILENAME)
+        out, stop = queue.Queue(maxsize=1), threading.Event()
+        worker = threading.Thread(
+            target=checklists._ingest_sheet, args=(path, FILENAME, "Teams", cfg, plans, out, stop, 1),
+        )
+        worker.start()
+        worker.join(timeout=1.5)
+
+        # One chunk queued, the next one waits for the parent
+        assert worker.is_alive()
+        assert out.qsize() == 1
+
+        stop.set()
+        worker.join()
+
+    def test_sheet_worker_errors_are_raised(self, path):
+        cfg, _ = checklists.resolve_checklist(config, FILENAME)
+
+        with pytest.raises(ValueError, match="no plans"):
+            list(iter_workbook_parallel(path, FILENAME, cfg, FailingPlans(), 2))
+
+
+class TestSheetPlans:
+
+    def test_plans_are_keyed_by_lower_cased_sheet_name(self):
+        plans = compile_checklist(config["2024-Panini-Select-Football-Checklist"], config["defaults"])
+
+        plan = plans["master checklist"]
+        assert plan.name == "Master Checklist"
+        assert plan.key_prefix == "2024-Panini-Select"
+        assert plan.columns["card"].indexes == (0, 1, 2, 3, 4)
+        assert plans["teams"].columns["master"].fields == (
+            "subset_name", "card_number", "player_name", "team_name", "print_run",
+        )
+
+    def test_plans_are_immutable(self):
+        plan = compile_checklist(config["2024-Panini-Select-Football-Checklist"])["base"]
+
+        with pytest.raises(TypeError):
+            plan.columns["card"] = None
+        with pytest.raises(AttributeError):
+            plan.key_prefix = "x"
+        assert isinstance(plan.new_card(plan.columns["card"], ("1", "", "", "")), ChecklistCard)
+
+
+class TestClassifyRow:
+
+    @pytest.mark.parametrize("row, is_parallel, expected", [
+        ((None, "1", "Name"), False, ("unknown", {})),
+        ((" ", "1", "Name"), False, ("unknown", {})),
+        (("Gold Parallels",), False, ("parallel_marker", {"parallel_name": "Gold Parallels"})),
+        ((" Gold /10 ", None, ""), True, ("parallel", {"parallel_name": "Gold /10"})),
+        (("Rookies",), False, ("subset", {"subset_name": "Rookies"})),
+        (("TM", 1, "Kyler Murray", "ARI", "/99"), False, ("master", {
+            "card_number": "1", "player_name": "Kyler Murray", "team_name": "ARI", "print_run": "/99",
+        })),
+        (("RC", "2", "Bo Nix", None), False, ("card", {
+            "card_number": "2", "player_name": "Bo Nix", "team_name": "",
+        })),
+        (("RC", "2", None), False, ("unknown", {})),
+    ])
+    def test_row_types(self, row, is_parallel, expected):
+        assert classify_row(row, is_parallel)[:2] == expected
+
+    def test_cells_are_extracted_once_and_padded(self):
+        _, _, cells = classify_row(("TM", 1, " Kyler Murray "), False, width=6)
+
+        assert cells == ("TM", "1", "Kyler Murray", "", "", "")
+
+    def test_matches_legacy_classifier(self):
+        is_parallel = False
+        for row in synthetic_sheet(5000, seed=7):
+            expected = legacy_classify_row(row, is_parallel)
+            assert classify_row(row, is_parallel)[:2] == expected
+            if expected[0] == "parallel_marker":
+                is_parallel = True
+            elif expected[0] == "card":
+                is_parallel = False
+
+
+class TestChecklistConfigRegistry:
+
+    @pytest.fixture
+    def config_path(self, tmp_path):
+        path = tmp_path / "checklists.yaml"
+        path.write_text(yaml.safe_dump(config), encoding="utf-8")
+        return path
+
+    def _edit(self, path, edit):
+        cfg = yaml.safe_load(path.read_text(encoding="utf-8"))
+        edit(cfg)
+        path.write_text(yaml.safe_dump(cfg), encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    def test_lookups_by_filename_and_sheet(self, config_path):
+        registry = ChecklistConfigRegistry(str(config_path))
+
+        compiled = registry.checklist(FILENAME)
+        assert compiled is registry.checklist("2024-Panini-Select-Football-Checklist")
+        assert compiled.key == "2024-Panini-Select-Football-Checklist"
+        assert registry.sheet_plan(FILENAME, "MASTER checklist").name == "Master Checklist"
+        assert registry.checklist("defaults") is None
+        assert registry.checklist("Unknown.xlsx") is None
+
+    def test_compiled_config_is_cached_on_disk(self, config_path, monkeypatch):
+        ChecklistConfigRegistry(str(config_path))
+        assert os.path.exists(f"{config_path}.compiled")
+
+        def fail(path):
+            raise AssertionError("config should come from the cache")
+
+        monkeypatch.setattr(checklists, "load_config", fail)
+        registry = ChecklistConfigRegistry(str(config_path))
+
+        assert registry.sheet_plan(FILENAME, "teams").columns["card"].indexes == (0, 1, 2, 3, 5)
+
+    def test_cache_is_plain_json_with_int_keys_restored(self, config_path):
+        ChecklistConfigRegistry(str(config_path))
+
+        with open(f"{config_path}.compiled", encoding="utf-8") as f:
+            json.load(f)
+        cached = ChecklistConfigRegistry(str(config_path)).config
+
+        assert cached == yaml.safe_load(config_path.read_text(encoding="utf-8"))
+        assert 0 in cached["2024-Panini-Select-Football-Checklist"]["sheets"]
+
+    def test_tampered_cache_is_never_unpickled(self, config_path, monkeypatch):
+        class Exploit:
+            def __reduce__(self):
+                return (os.system, ("false",))
+
+        cache_path = f"{config_path}.compiled"
+        with open(cache_path, "wb") as f:
+            pickle.dump(Exploit(), f)
+        monkeypatch.setattr(pickle, "load", lambda *a, **k: pytest.fail("cache was unpickled"))
+        monkeypatch.setattr(pickle, "loads", lambda *a, **k: pytest.fail("cache was unpickled"))
+
+        registry = ChecklistConfigRegistry(str(config_path))
+
+        assert registry.sheet_plan(FILENAME, "base").name == "Base"
+
+    def test_uncompilable_cache_falls_back_to_yaml(self, config_path):
+        registry = ChecklistConfigRegistry(str(config_path))
+        digest, mtime_ns = checklists.hash_file(str(config_path)), config_path.stat().st_mtime_ns
+        registry._write_cache(digest, mtime_ns, {"bogus": {"sheets": "not a mapping"}})
+
+        registry = ChecklistConfigRegistry(str(config_path))
+
+        assert registry.sheet_plan(FILENAME, "base").name == "Base"
+
+    def test_picks_up_config_changes(self, config_path):
+        registry = ChecklistConfigRegistry(str(config_path), check_interval=0)
+        assert registry.sheet_plan(FILENAME, "Rookies") is None
+
+        self._edit(config_path, lambda cfg: cfg[
+            "2024-Panini-Select-Football-Checklist"
+        ]["sheets"].update({7: {"name": "Rookies"}}))
+
+        assert registry.sheet_plan(FILENAME, "rookies").name == "Rookies"
+
+    def test_invalid_edit_keeps_previous_config(self, config_path):
+        registry = ChecklistConfigRegistry(str(config_path), check_interval=0)
+
+        self._edit(config_path, lambda cfg: cfg[
+            "2024-Panini-Select-Football-Checklist"
+        ]["sheets"][0].update({"columns": "missing_alias"}))
+
+        assert registry.refresh() is False
+        assert registry.sheet_plan(FILENAME, "base").name == "Base"
+
+    def test_missing_file_keeps_previous_config(self, config_path):
+        registry = ChecklistConfigRegistry(str(config_path), check_interval=0)
+        saved = config_path.read_text(encoding="utf-8")
+
+        config_path.unlink()
+        assert registry.refresh() is False
+        assert registry.sheet_plan(FILENAME, "base").name == "Base"
+
+        config_path.write_text(saved, encoding="utf-8")
+        self._edit(config_path, lambda cfg: cfg[
+            "2024-Panini-Select-Football-Checklist"
+        ]["sheets"].update({7: {"name": "Rookies"}}))
+        assert registry.refresh() is True
+        assert registry.sheet_plan(FILENAME, "rookies").name == "Rookies"
+
+    def test_registry_drives_ingest_and_pickles(self, workbook):
+        registry = ChecklistConfigRegistry(config=copy.deepcopy(config))
+
+        restored = pickle.loads(pickle.dumps(registry))
+
+        assert ingest_workbook(workbook, FILENAME, restored)["cards"].keys() == (
+            ingest_workbook(workbook, FILENAME, config)["cards"].keys()
+        )
@@ -1,6 +1,11 @@
+import hashlib
+import os
+import sqlite3
+
 from django.test import TestCase
-from mintcastiq.models import DimSet
-from domain.hashing import hash_object
+from mintcastiq.models import DimCard, DimSet
+from mintcastiq.serializers import canonical_hash_payload, serialize_for_hash
+from domain.hashing import DigestCache, hash_file, hash_file_multi, hash_object, hash_objects, hash_tree
 
 
 class TestIdentityHashing(TestCase):
@@ -47,3 +52,199 @@ class TestIdentityHashing(TestCase):
         # Change a non-identity field
         self.dim.status = "INACTIVE"
         self.assertEqual(self.dim.checksum, original_hash)
+
+
+class TestObjectHashing:
+
+    def _sets(self):
+        return [
+            DimSet(
+                set_name=name,
+                publisher="Panini",
+                set_year="2024",
+                subset_name='Base "Prizm" \\ Silver',
+                sport="Football",
+                set_code=f"code-{i}",
+            )
+            for i, name in enumerate(["Select", "Sélect", "Mosaic"])
+        ]
+
+    def test_payload_matches_serialize_for_hash(self):
+        instances = self._sets() + [
+            DimCard(cardset_id=7, card_number="RC-1", name="A", team_name="B"),
+            DimCard(card_number="2"),
+        ]
+        for instance in instances:
+            assert canonical_hash_payload(instance) == serialize_for_hash(instance).encode("utf-8")
+
+    def test_hash_object_does_not_print(self, capsys):
+        dim = self._sets()[0]
+
+        assert hash_object(dim) == hashlib.sha256(serialize_for_hash(dim).encode("utf-8")).hexdigest()
+        assert capsys.readouterr().out == ""
+
+    def test_hash_objects_matches_hash_object(self):
+        instances = self._sets() + [DimCard(cardset_id=1, card_number="1")] + self._sets()
+
+        assert list(hash_objects(instances)) == [hash_object(i) for i in instances]
+
+    def test_non_identity_fields_are_ignored(self):
+        a, b = self._sets()[0], self._sets()[0]
+        b.set_code = "something-else"
+        b.status = "INACTIVE"
+
+        assert hash_object(a) == hash_object(b)
+
+
+class TestBulkHashing:
+
+    def _tree(self, tmp_path):
+        (tmp_path / "sub" / "deeper").mkdir(parents=True)
+        files = {
+            tmp_path / "a.bin": b"a" * 3_000_001,
+            tmp_path / "sub" / "b.txt": b"checklist",
+            tmp_path / "sub" / "deeper" / "empty": b"",
+        }
+        for path, data in files.items():
+            path.write_bytes(data)
+        return files
+
+    def test_hash_file_matches_hashlib(self, tmp_path):
+        path = tmp_path / "a.bin"
+        path.write_bytes(b"x" * 2_500_000)
+
+        assert hash_file(str(path)) == hashlib.sha256(path.read_bytes()).hexdigest()
+        assert hash_file(str(path), "md5") == hashlib.md5(path.read_bytes()).hexdigest()
+
+    def test_multiple_algorithms_in_one_pass(self, tmp_path):
+        path = tmp_path / "a.bin"
+        path.write_bytes(b"y" * 100)
+
+        digests = hash_file_multi(str(path), ("sha256", "sha1"), buffer_size=7)
+
+        assert digests == {
+            "sha256": hashlib.sha256(b"y" * 100).hexdigest(),
+            "sha1": hashlib.sha1(b"y" * 100).hexdigest(),
+        }
+
+    def test_hash_tree_streams_every_file(self, tmp_path):
+        files = self._tree(tmp_path)
+
+        records = {r.path: r for r in hash_tree(str(tmp_path), ("sha256", "md5"), workers=2)}
+
+        assert set(records) == {str(p) for p in files}
+        for path, data in files.items():
+            record = records[str(path)]
+            assert record.error is None
+            assert record.size == len(data)
+            assert record.digests == {
+                "sha256": hashlib.sha256(data).hexdigest(),
+                "md5": hashlib.md5(data).hexdigest(),
+            }
+
+    def test_hash_tree_skips_symlinks(self, tmp_path):
+        self._tree(tmp_path)
+        (tmp_path / "link").symlink_to(tmp_path / "a.bin")
+
+        assert str(tmp_path / "link") not in {r.path for r in hash_tree(str(tmp_path))}
+
+
+class TestDigestCache:
+
+    # Well outside DigestCache.RACY_WINDOW_NS
+    OLD_MTIME_NS = 1_600_000_000 * 10 ** 9
+
+    def _file(self, tmp_path, name="a.bin", data=b"x" * 1000):
+        path = tmp_path / name
+        path.write_bytes(data)
+        os.utime(path, ns=(self.OLD_MTIME_NS, self.OLD_MTIME_NS))
+        return path
+
+    def test_unchanged_file_is_not_reread(self, tmp_path):
+        path = self._file(tmp_path)
+        with DigestCache(str(tmp_path / "cache.sqlite3")) as cache:
+            first = hash_file(str(path), cache=cache)
+
+            # Same size and mtime, different bytes: only a read could notice
+            path.write_bytes(b"y" * 1000)
+            os.utime(path, ns=(self.OLD_MTIME_NS, self.OLD_MTIME_NS))
+
+            assert hash_file(str(path), cache=cache) == first
+            assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_changed_stat_rehashes(self, tmp_path):
+        path = self._file(tmp_path)
+        with DigestCache(str(tmp_path / "cache.sqlite3")) as cache:
+            hash_file(str(path), cache=cache)
+            path.write_bytes(b"z" * 1001)
+
+            assert hash_file(str(path), cache=cache) == hashlib.sha256(b"z" * 1001).hexdigest()
+            assert cache.misses == 2
+
+    def test_replaced_file_rehashes(self, tmp_path):
+        path = self._file(tmp_path)
+        replacement = self._file(tmp_path, "b.bin", b"w" * 1000)
+        with DigestCache(str(tmp_path / "cache.sqlite3")) as cache:
+            hash_file(str(path), cache=cache)
+            os.replace(replacement, path)  # same size and mtime, new inode
+
+            assert hash_file(str(path), cache=cache) == hashlib.sha256(b"w" * 1000).hexdigest()
+            assert cache.hits == 0
+
+    def test_persists_across_instances(self, tmp_path):
+        path = self._file(tmp_path)
+        db = str(tmp_path / "cache.sqlite3")
+        with DigestCache(db) as cache:
+            hash_file(str(path), "md5", cache=cache)
+
+        with DigestCache(db) as cache:
+            assert hash_file(str(path), "md5", cache=cache) == hashlib.md5(b"x" * 1000).hexdigest()
+            assert cache.stats()["hits"] == 1
+
+            # A new algorithm for a cached file is a miss
+            hash_file(str(path), "sha1", cache=cache)
+            assert cache.misses == 1
+
+    def test_batched_stores_are_committed_on_exit(self, tmp_path):
+        path = self._file(tmp_path)
+        db = str(tmp_path / "cache.sqlite3")
+
+        with DigestCache(db) as cache:
+            hash_file(str(path), cache=cache)
+            assert sqlite3.connect(db).execute("SELECT COUNT(*) FROM file_digest").fetchone() == (0,)
+
+        assert sqlite3.connect(db).execute("SELECT COUNT(*) FROM file_digest").fetchone() == (1,)
+
+    def test_recently_modified_file_is_not_stored(self, tmp_path):
+        path = tmp_path / "fresh.bin"
+        path.write_bytes(b"x")
+        with DigestCache(str(tmp_path / "cache.sqlite3")) as cache:
+            hash_file(str(path), cache=cache)
+            hash_file(str(path), cache=cache)
+
+            assert cache.misses == 2
+            assert cache.stats()["entries"] == 0
+
+    def test_evict_missing(self, tmp_path):
+        kept = self._file(tmp_path, "kept.bin")
+        gone = self._file(tmp_path, "gone.bin")
+        with DigestCache(str(tmp_path / "cache.sqlite3")) as cache:
+            hash_file(str(kept), cache=cache)
+            hash_file(str(gone), cache=cache)
+            gone.unlink()
+
+            assert cache.evict_missing() == 1
+            assert cache.stats()["entries"] == 1
+
+    def test_hash_tree_uses_cache(self, tmp_path):
+        root = tmp_path / "tree"
+        root.mkdir()
+        for name in ("a.bin", "b.bin", "c.bin"):
+            self._file(root, name)
+
+        with DigestCache(str(tmp_path / "cache.sqlite3")) as cache:
+            first = {r.path: r.digests for r in hash_tree(str(root), ("sha256", "md5"), workers=2, cache=cache)}
+            second = {r.path: r.digests for r in hash_tree(str(root), ("sha256", "md5"), workers=2, cache=cache)}
+
+            assert first == second
+            assert (cache.hits, cache.misses) == (3, 3)
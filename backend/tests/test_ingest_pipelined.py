@@ -0,0 +1,134 @@
+import threading
+import time
+
+import pytest
+
+from domain.ingest.checklist_normalization_service import ChecklistNormalizationService
+from domain.ingest.ingest_dispatcher import IngestDispatcher
+from domain.ingest.pipeline import PipelinedIngest
+from domain.ingest.staging_writer import StagingBatchResult
+from mintcastiq.models.staging.staging_checklist_row import StagingChecklistRow
+
+
+class RecordingWriter:
+    """In-memory stand-in for StagingWriter."""
+
+    written = []
+    normalized = []
+    lock = threading.Lock()
+
+    def __init__(self, batch_size=3):
+        self.batch_size = batch_size
+        self.buffer = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def write(self, raw_row, normalized=None):
+        if raw_row.get("bad"):
+            raise ValueError("bad row")
+        if normalized is not None:
+            with self.lock:
+                RecordingWriter.normalized.append(normalized)
+        self.buffer.append(raw_row)
+        if len(self.buffer) >= self.batch_size:
+            return self.flush()
+        return None
+
+    def write_columns(self, raw_rows, normalized):
+        result = StagingBatchResult()
+        for i, raw_row in enumerate(raw_rows):
+            try:
+                flushed = self.write(raw_row, {field: values[i] for field, values in normalized.items()})
+            except ValueError as e:
+                result.errors.append((raw_row, str(e)))
+                continue
+            if flushed is not None:
+                result.written.extend(flushed.written)
+        return result
+
+    def flush(self):
+        batch, self.buffer = self.buffer, []
+        with self.lock:
+            RecordingWriter.written.extend(batch)
+        return StagingBatchResult(written=batch)
+
+    def close(self):
+        return self.flush()
+
+
+@pytest.fixture(autouse=True)
+def reset_writer():
+    RecordingWriter.written = []
+    RecordingWriter.normalized = []
+
+
+class TestPipelinedIngest:
+
+    def test_all_rows_reach_the_writers(self):
+        rows = ({"card_number": str(i)} for i in range(1000))
+
+        count, errors = PipelinedIngest(
+            rows, RecordingWriter, writer_threads=3, chunk_size=7, queue_size=2
+        ).run()
+
+        assert count == 1000
+        assert errors == []
+        assert sorted(int(r["card_number"]) for r in RecordingWriter.written) == list(range(1000))
+
+    def test_write_errors_are_attributed(self):
+        rows = [{"card_number": "1"}, {"card_number": "2"}, {"card_number": "3", "bad": True}]
+
+        pipeline = PipelinedIngest(iter(rows), RecordingWriter)
+        count, errors = pipeline.run()
+
+        assert count == 2
+        assert errors == [({"card_number": "3", "bad": True}, "bad row")]
+        assert pipeline.stats["parse"].count == 3
+        assert pipeline.stats["normalize"].count == 3
+
+    def test_parse_failure_is_reraised(self):
+        def rows():
+            yield {"card_number": "1"}
+            raise FileNotFoundError("gone")
+
+        with pytest.raises(FileNotFoundError):
+            PipelinedIngest(rows(), RecordingWriter, queue_size=1, chunk_size=1).run()
+
+    def test_normalizer_runs_per_chunk_and_reaches_the_writers(self):
+        rows = [{"set_name": "2025 topps", "card_number": f" {i}a ", "player_name": "mike  trout"} for i in range(10)]
+        chunks = []
+
+        def normalizer(chunk):
+            chunks.append(len(chunk))
+            return ChecklistNormalizationService.run_staging(chunk)
+
+        count, errors = PipelinedIngest(iter(rows), RecordingWriter, normalizer=normalizer, chunk_size=4).run()
+
+        assert (count, errors) == (10, [])
+        assert chunks == [4, 4, 2]
+        assert sorted(n["card_number"] for n in RecordingWriter.normalized) == sorted(f"{i}A" for i in range(10))
+        assert {n["player"] for n in RecordingWriter.normalized} == {"Mike Trout"}
+
+
+@pytest.mark.django_db
+class TestSequentialStaging:
+
+    def test_rows_are_staged_with_normalized_values(self, tmp_path):
+        rows = [
+            {"set_name": "2025 topps", "card_number": "1", "player_name": "mike trout", "_row": 2},
+            {"set_name": None, "card_number": " 2a ", "player_name": "aaron judge", "_row": 3},
+        ]
+        dispatcher = IngestDispatcher(tmp_path, batch_size=1)
+
+        count, errors, skipped = dispatcher._stage_rows(iter(rows), time.time())
+
+        assert (count, errors, skipped) == (2, [], 0)
+        staged = {r.raw_row["_row"]: r for r in StagingChecklistRow.objects.all()}
+        assert (staged[2].normalized_set, staged[2].normalized_player) == ("2025 Topps", "Mike Trout")
+        # A failed field stays empty; the row is still staged for validation to flag
+        assert (staged[3].normalized_set, staged[3].normalized_card_number) == (None, "2A")
@@ -0,0 +1,168 @@
+import datetime
+
+import openpyxl
+import pytest
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from domain.ingest.parsers.csv_parser import CSVChecklistParser
+from domain.ingest.parsers.excel_parser import ExcelChecklistParser
+from domain.ingest.staging_writer import CopyStagingWriter, StagingWriter
+from mintcastiq.models.staging.staging_checklist_row import StagingChecklistRow
+
+
+@pytest.mark.django_db
+class TestStagingWriter:
+
+    def test_rows_are_buffered_until_batch_is_full(self):
+        writer = StagingWriter(batch_size=3)
+
+        assert writer.write({"card_number": "1"}) is None
+        assert writer.write({"card_number": "2"}) is None
+        assert StagingChecklistRow.objects.count() == 0
+
+        result = writer.write({"card_number": "3"})
+
+        assert len(result.written) == 3
+        assert result.errors == []
+        assert StagingChecklistRow.objects.count() == 3
+
+    def test_context_manager_flushes_remainder(self):
+        with StagingWriter(batch_size=100) as writer:
+            for i in range(5):
+                writer.write({"card_number": str(i)})
+
+        assert StagingChecklistRow.objects.count() == 5
+
+    def test_close_returns_final_batch(self):
+        writer = StagingWriter(batch_size=100)
+        writer.write({"card_number": "1", "release": datetime.date(2024, 9, 15)})
+
+        result = writer.close()
+
+        assert len(result.written) == 1
+        assert StagingChecklistRow.objects.get().raw_row["release"] == "2024-09-15"
+        assert writer.close().written == []
+
+    def test_normalized_values_fill_staging_columns(self):
+        with StagingWriter(batch_size=10) as writer:
+            writer.write(
+                {"card_number": " 1a "},
+                {"set": "2025 Topps", "card_number": "1A", "player": "Mike Trout", "parallel": None},
+            )
+
+        row = StagingChecklistRow.objects.get()
+        assert (row.normalized_set, row.normalized_card_number, row.normalized_player) == (
+            "2025 Topps", "1A", "Mike Trout",
+        )
+        assert row.raw_row == {"card_number": " 1a "}
+
+    def test_normalized_columns_are_written_per_batch(self):
+        rows = [{"card_number": f" {i}a "} for i in range(5)]
+        columns = {"set": ["2025 Topps"] * 5, "card_number": [f"{i}A" for i in range(5)]}
+        writer = StagingWriter(batch_size=2)
+
+        result = writer.write_columns(rows, columns)
+
+        assert len(result.written) == 4
+        assert len(writer.close().written) == 1
+        staged = {row.raw_row["card_number"]: row for row in StagingChecklistRow.objects.all()}
+        assert staged[" 3a "].normalized_card_number == "3A"
+        assert {row.normalized_set for row in staged.values()} == {"2025 Topps"}
+
+
+@pytest.mark.django_db
+class TestCopyStagingWriter:
+
+    def test_writes_all_rows_in_batches(self):
+        with CopyStagingWriter(batch_size=2) as writer:
+            results = [writer.write({"card_number": str(i)}) for i in range(5)]
+
+        assert [len(r.written) for r in results if r] == [2, 2]
+        assert StagingChecklistRow.objects.count() == 5
+        assert sorted(r.raw_row["card_number"] for r in StagingChecklistRow.objects.all()) == [
+            "0", "1", "2", "3", "4",
+        ]
+
+    @pytest.mark.skipif(connection.vendor != "postgresql", reason="COPY requires PostgreSQL")
+    def test_copies_batches_inside_an_outer_transaction(self):
+        # ON COMMIT DROP doesn't fire between batches here; each batch must still COPY
+        with CaptureQueriesContext(connection) as ctx, transaction.atomic():
+            with CopyStagingWriter(batch_size=2) as writer:
+                for i in range(5):
+                    writer.write({"card_number": str(i)})
+
+        copied = [q for q in ctx.captured_queries if CopyStagingWriter.TEMP_TABLE in q["sql"]
+                  and q["sql"].startswith("INSERT")]
+        assert len(copied) == 3
+        assert StagingChecklistRow.objects.count() == 5
+
+
+@pytest.mark.django_db
+class TestStagingIdempotency:
+
+    def test_content_hash_is_stable_across_key_order(self):
+        a = StagingWriter.content_hash({"card_number": "1", "_file": "a.csv"})
+        b = StagingWriter.content_hash({"_file": "a.csv", "card_number": "1"})
+
+        assert a == b
+        assert len(a) == 64
+
+    def test_reingesting_identical_rows_is_skipped(self):
+        rows = [{"card_number": str(i), "_file": "a.csv", "_row": i + 2} for i in range(4)]
+
+        with StagingWriter(batch_size=10) as writer:
+            for row in rows:
+                writer.write(row)
+
+        writer = StagingWriter(batch_size=10)
+        for row in rows:
+            writer.write(row)
+        writer.write({"card_number": "new", "_file": "a.csv", "_row": 99})
+        result = writer.close()
+
+        assert len(result.written) == 1
+        assert result.skipped == 4
+        assert StagingChecklistRow.objects.count() == 5
+
+    def test_duplicates_within_a_batch_are_collapsed(self):
+        writer = StagingWriter(batch_size=10)
+        writer.write({"card_number": "1", "_file": "a.csv", "_row": 2})
+        writer.write({"card_number": "1", "_file": "a.csv", "_row": 2})
+
+        result = writer.close()
+
+        assert len(result.written) == 1
+        assert result.skipped == 1
+
+    def test_rows_with_non_string_keys_are_staged(self, tmp_path):
+        # A blank header cell over a populated column yields a None key
+        path = tmp_path / "checklist.xlsx"
+        wb = openpyxl.Workbook()
+        wb.active.append(("card_number", "player_name", None))
+        wb.active.append(("1", "Mike Trout", "note"))
+        wb.active.append(("2", "Aaron Judge", None))
+        wb.save(path)
+
+        # csv.DictReader files extra fields under a None key
+        csv_path = tmp_path / "checklist.csv"
+        csv_path.write_text("card_number,player_name\n3,Shohei Ohtani,note\n", encoding="utf-8")
+
+        rows = list(ExcelChecklistParser(path).parse()) + list(CSVChecklistParser(csv_path).parse())
+        assert all(None in row for row in (rows[0], rows[2]))
+
+        with StagingWriter(batch_size=10) as writer:
+            results = [writer.write(row) for row in rows] + [writer.close()]
+
+        assert sum(len(r.errors) for r in results if r) == 0
+        assert StagingChecklistRow.objects.count() == 3
+
+    def test_identical_csv_rows_are_kept_apart_by_row_number(self, tmp_path):
+        path = tmp_path / "checklist.csv"
+        path.write_text("card_number,player_name\n1,Mike Trout\n1,Mike Trout\n", encoding="utf-8")
+
+        with StagingWriter(batch_size=10) as writer:
+            for row in CSVChecklistParser(path).parse():
+                writer.write(dict(row, _file=path.name))
+
+        assert StagingChecklistRow.objects.count() == 2